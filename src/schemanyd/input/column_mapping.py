@@ -1,26 +1,78 @@
-from typing import TYPE_CHECKING, Dict
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from ..schemanyd import Schemanyd
+    from ..utility.graph import Column, Relationship
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _parse_spec(spec: str, rf: str, rr: str) -> Tuple[str, str, str, str]:
+    """
+    Split a mapping spec into (relation path, parent path, relation, field), `''` for missing parts.
+
+    Mappings are usually reused for many inserts, so every distinct spec is only tokenized once.
+    """
+    rel_part, _, field = spec.rpartition(rf)
+    parent, _, rel = rel_part.rpartition(rr)
+    return rel_part, parent, rel, field
+
 
 class ColumnMapping:
 
     def __init__(self, schemanyd_obj: "Schemanyd", column_mapping: Dict[str, str]):
+        """
+        Parses the column mapping once, the tokens are stored as parallel lists (one entry per mapped column).
+
+        `'citizenship': 'traveler/country.name'` → csv_col `citizenship`, parent_rel `traveler`, rel `country`, field `name`
+        """
         self.schemanyd_obj = schemanyd_obj
         self.column_mapping = column_mapping
 
+        rf, rr = schemanyd_obj.seperator_rf, schemanyd_obj.seperator_rr
+
+        self.csv_cols: List[str] = []
+        self.rel_paths: List[str] = []  # full relation path, e.g. 'traveler/country'
+        self.parent_rels: List[Optional[str]] = []  # None if the relation is mentioned without a parent
+        self.rels: List[str] = []
+        self.fields: List[str] = []
+
+        # Every relation path (also those only mentioned as parent) mapped to its parent path
+        self.paths: Dict[str, Optional[str]] = {}
+
+        for csv_col, spec in column_mapping.items():
+            rel_part, parent, rel, field = _parse_spec(spec, rf, rr)
+            if not rel_part or not field:
+                raise ValueError(f"Invalid column mapping '{csv_col}': '{spec}', expected '<relation>{rf}<field>'")
+
+            self.csv_cols.append(csv_col)
+            self.rel_paths.append(rel_part)
+            self.parent_rels.append(parent or None)
+            self.rels.append(rel)
+            self.fields.append(field)
+
+            path = rel_part
+            while path and path not in self.paths:
+                self.paths[path] = path.rpartition(rr)[0] or None
+                path = self.paths[path]
+
 
     def check(self):
-        print("ColumnMapping.check() is not implemented yet, be aware.")
-        pass
+        logger.warning("ColumnMapping.check() is only partially implemented yet, be aware.")
 
         # 2.2. | Check if every mentioned database field even exists in the schema
 
+        self.columns = self.resolve_columns()
+
         # 2.2.1. | Check if the data types match (maybe also check for similiar names / typos)
 
         # 2.3. | Check if fields which are mentioned without any long syntax ('.../...') have multiple foreign keys pointing to them
 
         # 2.3.1. | Check which foreign key is closer / choose it and give a warning / return in how it was joined, which one was taken, throw an error if they are equally close
+        # (for now trace() raises whenever a parent has more than one foreign key to the relation)
 
         # 2.4. | For every table, check if all fields which are notnull are given
 
@@ -29,3 +81,50 @@ class ColumnMapping:
         # 2.4.2. | If it would be possible, check if all entries already exist, or if I would need to add new (then this can't be done, but a dataset with the found values can be returned)
 
         # 2.5. | Check with a Graph Path-Tracing, if the join is possible, provide detailed feedback which exact point might cause issues
+
+        self.joins = self.schemanyd_obj._trace_join(self)
+
+
+    def resolve_columns(self) -> List["Column"]:
+        """ The schema Column behind every mapped field (same order as `csv_cols`), raises a ValueError for unknown tables or fields. """
+        graph = self.schemanyd_obj.db.graph
+        rf = self.schemanyd_obj.seperator_rf
+
+        columns: List["Column"] = []
+        for rel, field in zip(self.rels, self.fields):
+            column = graph.get_table_by_name(rel, throw_error=True).get_column_by_name(field)
+            if column is None:
+                raise ValueError(f"Field '{rel}{rf}{field}' of the column mapping not found in schema")
+            columns.append(column)
+        return columns
+
+
+    def trace(self) -> Dict[str, "Relationship"]:
+        """
+        Graph Path-Tracing (2.5) for every `parent/relation` link of the mapping.
+
+        Returns the foreign key relationship from the parent table to the relation table, keyed by the relation path
+        (`'traveler/country'`). Raises a ValueError if a table is unknown, or if the parent has no foreign key or more than
+        one foreign key to the relation (which of them is meant can't be told from the mapping, see 2.3.1).
+        """
+        rr = self.schemanyd_obj.seperator_rr
+        graph = self.schemanyd_obj.db.graph
+
+        joins: Dict[str, "Relationship"] = {}
+        for path, parent_path in self.paths.items():
+            rel = path.rpartition(rr)[2]  # the table of a relation path is its last segment
+            graph.get_table_by_name(rel, throw_error=True)
+            if parent_path is None:
+                continue
+
+            parent = graph.get_table_by_name(parent_path.rpartition(rr)[2], throw_error=True)
+
+            candidates = [r for r in parent.relationships if r.source.table is parent and r.target.table.name == rel]
+            if not candidates:
+                raise ValueError(f"Join not possible for '{path}': table '{parent.name}' has no foreign key pointing to '{rel}'")
+            if len(candidates) > 1:
+                fk_columns = ", ".join(sorted(r.source.name for r in candidates))
+                raise ValueError(f"Join ambiguous for '{path}': table '{parent.name}' has multiple foreign keys pointing to '{rel}' ({fk_columns})")
+            joins[path] = candidates[0]
+
+        return joins
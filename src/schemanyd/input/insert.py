@@ -1,13 +1,15 @@
-from typing import Any, Dict, Union
+from typing import Any, AsyncIterator, Dict, Optional, Union
 from io import BytesIO
+from queue import Empty, SimpleQueue
 
 import polars as pl
 import pandas as pd
+import pyarrow as pa
 
 
 # - - - - - Wrapper Functions - Convert various data types to CSV BytesIO (file-like) - - - - -
 
-def csv_from_dicts(data_dicts: list[dict[str, Any]]) -> BytesIO:
+def csv_from_dicts(data_dicts: list[dict[str, Any]], buffer: Optional[BytesIO] = None) -> BytesIO:
     """
     Convert a list of dictionaries to CSV bytes.
 
@@ -15,6 +17,8 @@ def csv_from_dicts(data_dicts: list[dict[str, Any]]) -> BytesIO:
     ----------
     data_dicts: list[dict[str, Any]]
         Iterable of dictionaries that should be converted into CSV format.
+    buffer: BytesIO, optional
+        Buffer to write into (it is cleared first). Defaults to a pooled buffer, see `release_buffer`.
 
     Returns
     -------
@@ -23,12 +27,10 @@ def csv_from_dicts(data_dicts: list[dict[str, Any]]) -> BytesIO:
         encoded CSV representation of the provided dictionaries.
     """
     df = pl.DataFrame(data_dicts)
-    buffer = BytesIO(df.write_csv().encode('utf-8'))
-    buffer.seek(0)
-    return buffer
+    return _write_csv(df, buffer)
 
 
-def csv_from_polars(df: pl.DataFrame) -> BytesIO:
+def csv_from_polars(df: pl.DataFrame, buffer: Optional[BytesIO] = None) -> BytesIO:
     """
     Convert a Polars DataFrame to CSV bytes.
 
@@ -36,6 +38,8 @@ def csv_from_polars(df: pl.DataFrame) -> BytesIO:
     ----------
     df: pl.DataFrame
         DataFrame to serialize to CSV.
+    buffer: BytesIO, optional
+        Buffer to write into (it is cleared first). Defaults to a pooled buffer, see `release_buffer`.
 
     Returns
     -------
@@ -43,12 +47,10 @@ def csv_from_polars(df: pl.DataFrame) -> BytesIO:
         An in-memory binary file-like object (positioned at start) containing the UTF-8
         encoded CSV representation of the DataFrame.
     """
-    buffer = BytesIO(df.write_csv().encode('utf-8'))
-    buffer.seek(0)
-    return buffer
+    return _write_csv(df, buffer)
 
 
-def csv_from_pandas(df: 'pd.DataFrame') -> BytesIO:
+def csv_from_pandas(df: 'pd.DataFrame', buffer: Optional[BytesIO] = None) -> BytesIO:
     """
     Convert a Pandas DataFrame to CSV bytes.
 
@@ -56,6 +58,8 @@ def csv_from_pandas(df: 'pd.DataFrame') -> BytesIO:
     ----------
     df: pd.DataFrame
         DataFrame to serialize to CSV. Index is ignored.
+    buffer: BytesIO, optional
+        Buffer to write into (it is cleared first). Defaults to a pooled buffer, see `release_buffer`.
 
     Returns
     -------
@@ -63,12 +67,11 @@ def csv_from_pandas(df: 'pd.DataFrame') -> BytesIO:
         An in-memory binary file-like object (positioned at start) containing the UTF-8
         encoded CSV representation of the DataFrame.
     """
-    buffer = BytesIO(df.to_csv(index=False).encode('utf-8'))
-    buffer.seek(0)
-    return buffer
+    # Serialize through Polars' native CSV writer instead of pandas' Python-level one
+    return _write_csv(frame_from_pandas(df), buffer)
 
 
-def csv_from_csv_file(file_path: str) -> BytesIO:
+def csv_from_csv_file(file_path: str, buffer: Optional[BytesIO] = None) -> BytesIO:
     """
     Read a CSV file from disk and return its bytes.
 
@@ -76,6 +79,8 @@ def csv_from_csv_file(file_path: str) -> BytesIO:
     ----------
     file_path: str
         Absolute or relative path to the CSV file.
+    buffer: BytesIO, optional
+        Buffer to write into (it is cleared first). Defaults to a pooled buffer, see `release_buffer`.
 
     Returns
     -------
@@ -83,15 +88,15 @@ def csv_from_csv_file(file_path: str) -> BytesIO:
         An in-memory binary file-like object (positioned at start) containing the raw
         file contents as bytes.
     """
+    buffer = acquire_buffer(buffer)
     with open(file_path, 'rb') as f:
-        data = f.read()
+        buffer.write(f.read())
 
-    buffer = BytesIO(data)
     buffer.seek(0)
     return buffer
 
 
-def csv_from_excel_file(file_path: str, sheet_name: Union[str, int, None] = None) -> BytesIO:
+def csv_from_excel_file(file_path: str, sheet_name: Union[str, int, None] = None, buffer: Optional[BytesIO] = None) -> BytesIO:
     """
     Convert an Excel sheet to CSV bytes.
 
@@ -101,6 +106,8 @@ def csv_from_excel_file(file_path: str, sheet_name: Union[str, int, None] = None
         Absolute or relative path to the Excel file (.xlsx or .xls).
     sheet_name: Union[str, int, None], optional
         Sheet identifier to read. Defaults to the first sheet when omitted.
+    buffer: BytesIO, optional
+        Buffer to write into (it is cleared first). Defaults to a pooled buffer, see `release_buffer`.
 
     Returns
     -------
@@ -108,11 +115,242 @@ def csv_from_excel_file(file_path: str, sheet_name: Union[str, int, None] = None
         An in-memory binary file-like object (positioned at start) containing the UTF-8
         encoded CSV representation of the selected sheet.
     """
+    return _write_csv(frame_from_excel_file(file_path, sheet_name), buffer)
+
+
+# - - - - - Frame Functions - Convert in-memory data to (Arrow-backed) Polars DataFrames - - - - -
+
+def frame_from_dicts(data_dicts: list[dict[str, Any]]) -> pl.DataFrame:
+    """
+    Convert a list of dictionaries to a Polars DataFrame.
+
+    Parameters
+    ----------
+    data_dicts: list[dict[str, Any]]
+        Iterable of dictionaries (each dict is a row).
+
+    Returns
+    -------
+    pl.DataFrame
+        DataFrame holding the rows in columnar (Arrow) memory, no CSV encoding involved.
+    """
+    return pl.DataFrame(data_dicts)
+
+
+def frame_from_pandas(df: 'pd.DataFrame') -> pl.DataFrame:
+    """
+    Convert a Pandas DataFrame to a Polars DataFrame.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        DataFrame to convert. Index is ignored.
+
+    Returns
+    -------
+    pl.DataFrame
+        DataFrame sharing the Arrow buffers of the numeric pandas columns where possible.
+    """
+    # pandas → Arrow → Polars, the index is dropped before any conversion happens and
+    # pl.from_arrow takes over the Arrow buffers without copying them again
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    return pl.from_arrow(table, rechunk=False)
+
+
+def frame_from_excel_file(file_path: str, sheet_name: Union[str, int, None] = None) -> pl.DataFrame:
+    """
+    Read an Excel sheet into a Polars DataFrame using the Rust-based calamine engine.
+
+    Parameters
+    ----------
+    file_path: str
+        Absolute or relative path to the Excel file (.xlsx or .xls).
+    sheet_name: Union[str, int, None], optional
+        Sheet identifier to read. Defaults to the first sheet when omitted.
+
+    Returns
+    -------
+    pl.DataFrame
+        DataFrame containing the selected sheet.
+    """
     if sheet_name is None:
-        df = pl.read_excel(file_path)
-    else:
-        df = pl.read_excel(file_path, sheet_name=sheet_name)
+        return pl.read_excel(file_path, engine="calamine")
+    return pl.read_excel(file_path, sheet_name=sheet_name, engine="calamine")
+
 
-    buffer = BytesIO(df.write_csv().encode('utf-8'))
+# - - - - - IPC Functions - Convert in-memory data to Arrow IPC BytesIO (file-like) - - - - -
+
+# Every Arrow IPC file starts with these magic bytes, `Schemanyd.insert` uses them to tell IPC and CSV streams apart
+ARROW_IPC_MAGIC = b"ARROW1"
+
+
+def ipc_from_dicts(data_dicts: list[dict[str, Any]], schema: Optional[Dict[str, pl.DataType]] = None, buffer: Optional[BytesIO] = None) -> BytesIO:
+    """
+    Convert a list of dictionaries to uncompressed Arrow IPC bytes.
+
+    Parameters
+    ----------
+    data_dicts: list[dict[str, Any]]
+        Iterable of dictionaries (each dict is a row).
+    schema: Dict[str, pl.DataType], optional
+        Column types of the rows. If given, the types are not inferred from the rows.
+    buffer: BytesIO, optional
+        Buffer to write into (it is cleared first). Defaults to a pooled buffer, see `release_buffer`.
+
+    Returns
+    -------
+    BytesIO
+        An in-memory binary file-like object (positioned at start) containing the columnar buffers
+        of the rows, no text encoding is involved.
+    """
+    df = pl.from_records(data_dicts, schema=schema)
+    buffer = acquire_buffer(buffer)
+    df.write_ipc(buffer, compression="uncompressed")
+    buffer.seek(0)
+    return buffer
+
+
+def is_ipc(buffer: BytesIO) -> bool:
+    """ Whether the buffer holds Arrow IPC data (checked by its magic bytes, the position is kept). """
+    with buffer.getbuffer() as view:  # released right away, an exported buffer would block resizing / reusing the BytesIO
+        return view[:len(ARROW_IPC_MAGIC)] == ARROW_IPC_MAGIC
+
+
+# - - - - - Scan Functions - Lazily read files, so only the needed columns are loaded - - - - -
+
+# Chunks × columns the CSV reader may allocate at once, above this budget the reader is switched to low_memory mode
+_CSV_CHUNK_BUDGET = 500_000
+
+
+def low_memory_for(n_cols: int) -> bool:
+    """
+    Whether a CSV with `n_cols` parsed columns should be read in low_memory mode.
+
+    Polars splits the input into about `threads * 16` chunks and allocates every column per chunk,
+    for very wide inputs these allocations outweigh the gain of parsing in parallel.
+    """
+    return pl.thread_pool_size() * 16 * n_cols > _CSV_CHUNK_BUDGET
+
+
+def scan_from_csv_file(file_path: str, has_header: bool = True, schema_overrides: Optional[Dict[str, pl.DataType]] = None, low_memory: bool = False) -> pl.LazyFrame:
+    """
+    Lazily scan a CSV file from disk.
+
+    Parameters
+    ----------
+    file_path: str
+        Absolute or relative path to the CSV file.
+    has_header: bool
+        Whether the CSV file has a header row.
+    schema_overrides: Dict[str, pl.DataType], optional
+        Known column types (see `dtype_from_sql`). If given, schema inference is skipped entirely,
+        columns without a type are read as strings.
+    low_memory: bool
+        Parse in fewer, smaller chunks (see `low_memory_for`).
+
+    Returns
+    -------
+    pl.LazyFrame
+        LazyFrame over the file. Nothing but the header is read until it is collected, and a
+        `select` on it is pushed down into the reader so unused columns are never loaded.
+    """
+    if schema_overrides is None:
+        return pl.scan_csv(file_path, has_header=has_header, low_memory=low_memory)
+    return pl.scan_csv(file_path, has_header=has_header, schema_overrides=schema_overrides, infer_schema=False, low_memory=low_memory)
+
+
+# - - - - - Type Functions - Map database column types to Polars types - - - - -
+
+# Looked up by the exact type name (without any "(...)" arguments), a prefix match would also hit e.g. INTERVAL
+_SQL_DTYPES = {
+    "INTEGER": pl.Int32,
+    "INT": pl.Int32,
+    "INT4": pl.Int32,
+    "BIGINT": pl.Int64,
+    "INT8": pl.Int64,
+    "SMALLINT": pl.Int16,
+    "INT2": pl.Int16,
+    "DOUBLE PRECISION": pl.Float64,
+    "DOUBLE": pl.Float64,
+    "FLOAT8": pl.Float64,
+    "FLOAT": pl.Float64,
+    "REAL": pl.Float32,
+    "FLOAT4": pl.Float32,
+}
+
+
+def dtype_from_sql(data_type: str) -> pl.DataType:
+    """
+    Polars type to parse a CSV column with, based on the type of the database column it is inserted into.
+
+    Only integer and floating point columns are parsed, everything else (text, dates, numerics, intervals, booleans, ...)
+    stays a string and is converted by the database itself, which is more lenient than the CSV parser.
+    """
+    name = data_type.partition("(")[0].strip().upper()
+    return _SQL_DTYPES.get(name, pl.String)
+
+
+# - - - - - Stream Functions - Feed data to the database chunk by chunk - - - - -
+
+async def csv_chunks(df: pl.DataFrame, chunk_rows: int = 50_000) -> AsyncIterator[bytes]:
+    """
+    Serialize a Polars DataFrame to headerless UTF-8 CSV, one slice of rows at a time.
+
+    Used as `COPY ... FROM STDIN` source, so only a single chunk of CSV bytes exists at any point in time
+    instead of the whole table.
+
+    Parameters
+    ----------
+    df: pl.DataFrame
+        DataFrame to serialize.
+    chunk_rows: int
+        Number of rows per chunk.
+
+    Yields
+    ------
+    bytes
+        CSV encoded rows of the current chunk.
+    """
+    for offset in range(0, df.height, chunk_rows):
+        buffer = BytesIO()
+        df.slice(offset, chunk_rows).write_csv(buffer, include_header=False)
+        yield buffer.getvalue()
+
+
+# - - - - - Buffer Pool - Reuse BytesIO objects across many small inserts - - - - -
+
+_BUFFER_POOL: "SimpleQueue[BytesIO]" = SimpleQueue()
+_BUFFER_POOL_SIZE = 32  # released buffers beyond this are left to the garbage collector
+
+
+def acquire_buffer(buffer: Optional[BytesIO] = None) -> BytesIO:
+    """ The given buffer, a pooled one or a new one, always emptied and positioned at start. """
+    if buffer is None:
+        try:
+            buffer = _BUFFER_POOL.get_nowait()
+        except Empty:
+            return BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+
+def release_buffer(buffer: BytesIO) -> None:
+    """ Hand a buffer which is no longer used back to the pool, it must not be accessed afterwards. """
+    if _BUFFER_POOL.qsize() < _BUFFER_POOL_SIZE:
+        _BUFFER_POOL.put(buffer)
+
+
+# - - - - - Helper Functions - - - - -
+
+def _write_csv(df: pl.DataFrame, buffer: Optional[BytesIO] = None) -> BytesIO:
+    """
+    Write a Polars DataFrame as UTF-8 CSV straight into a BytesIO.
+
+    Polars streams the encoded bytes into the buffer, so neither an intermediate `str`
+    nor a second `bytes` copy of the CSV is created.
+    """
+    buffer = acquire_buffer(buffer)
+    df.write_csv(buffer)
     buffer.seek(0)
     return buffer
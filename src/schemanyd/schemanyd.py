@@ -1,7 +1,6 @@
-schemanyd.py
-
 # Preinstalled
-from typing import Dict, Any, Union
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple, Union
+from functools import singledispatch
 from io import BytesIO
 from pathlib import Path
 import uuid
@@ -17,10 +16,112 @@ from schemanyd.input.insert import (
     csv_from_polars,
     csv_from_pandas,
     csv_from_csv_file,
-    csv_from_excel_file
+    csv_from_excel_file,
+    frame_from_dicts,
+    frame_from_pandas,
+    frame_from_excel_file,
+    scan_from_csv_file,
+    dtype_from_sql,
+    is_ipc,
+    release_buffer,
+    low_memory_for,
+    csv_chunks
 )
 from schemanyd.input.column_mapping import ColumnMapping
 
+if TYPE_CHECKING:
+    from schemanyd.utility.graph import Column, Relationship
+
+# - - - - - to_BytesIO Converters - - - - -
+
+_UNSUPPORTED_TYPE = ("Unsupported data type: {}. "
+                     "Supported types: list[dict], polars.DataFrame, pandas.DataFrame, "
+                     "str (file path), BytesIO")
+
+
+def _bytesio_from_bytesio(data: BytesIO) -> BytesIO:
+    """ Already a BytesIO - just ensure it's at the start """
+    data.seek(0)
+    return data
+
+
+def _bytesio_from_list(data: list) -> BytesIO:
+    """ List of dictionaries """
+    if data and isinstance(data[0], dict):
+        return csv_from_dicts(data)
+    raise TypeError(_UNSUPPORTED_TYPE.format(type(data)))
+
+
+def _bytesio_from_path(data: str) -> BytesIO:
+    """ File path (string), a missing file is reported by open() itself instead of an extra exists() check """
+    suffix = Path(data).suffix.lower()
+    if suffix == '.csv':
+        converter = csv_from_csv_file
+    elif suffix in ['.xlsx', '.xls']:
+        converter = csv_from_excel_file
+    else:
+        raise ValueError(f"Unsupported file extension: {suffix}. Supported: .csv, .xlsx, .xls")
+
+    try:
+        return converter(data)
+    except FileNotFoundError as exc:
+        raise ValueError(f"File not found: {data}") from exc
+
+
+# Resolved by the type's MRO (C-level and cached), pl.DataFrame and pd.DataFrame are no longer told apart by class name
+@singledispatch
+def _to_bytesio(data: Any) -> BytesIO:
+    raise TypeError(_UNSUPPORTED_TYPE.format(type(data)))
+
+
+_to_bytesio.register(BytesIO, _bytesio_from_bytesio)
+_to_bytesio.register(list, _bytesio_from_list)
+_to_bytesio.register(pl.DataFrame, csv_from_polars)
+_to_bytesio.register(pd.DataFrame, csv_from_pandas)
+_to_bytesio.register(str, _bytesio_from_path)
+
+
+def _quote(identifier: str) -> str:
+    """ Quote an SQL identifier, mapped column names like 'traveler/country.name' are used as-is in the temporary table. """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _quote_table(name: str) -> str:
+    """ Quote a (possibly schema-qualified) table name part by part, 'public.country' → '"public"."country"'. """
+    return ".".join(_quote(part) for part in name.split("."))
+
+
+def _insertion_levels(schema_graph: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Group the tables by foreign key depth (Kahn's algorithm), every table only references tables of earlier levels.
+
+    Self references are ignored, tables which are part of a foreign key cycle are collected in a final level.
+    """
+    dependencies = {table: set(refs) & schema_graph.keys() - {table} for table, refs in schema_graph.items()}
+    dependents: Dict[str, List[str]] = {table: [] for table in dependencies}
+    for table, refs in dependencies.items():
+        for ref in refs:
+            dependents[ref].append(table)
+
+    remaining = {table: len(refs) for table, refs in dependencies.items()}
+    levels = []
+    level = [table for table, count in remaining.items() if count == 0]
+    while level:
+        levels.append(level)
+        next_level = []
+        for table in level:
+            for dependent in dependents[table]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    cyclic = [table for table, count in remaining.items() if count > 0]
+    if cyclic:
+        levels.append(cyclic)
+    return levels
+
+
 class Schemanyd:
 
     def __init__(self, database_obj: Database, seperator_rf = ".", seperator_rr = "/"):
@@ -37,6 +138,80 @@ class Schemanyd:
         self.seperator_rf = seperator_rf
         self.seperator_rr = seperator_rr
 
+        # Graph Path-Tracing results (2.5), only valid for the schema version they were traced on
+        self._join_cache: Dict[frozenset, Dict[str, "Relationship"]] = {}
+        self._join_cache_version = None
+
+        # Tables grouped by foreign key depth (6.1), only valid for the schema version they were computed on
+        self._insert_order_cache: List[List[str]] = []
+        self._insert_order_version = None
+
+    # - - - - - Check Helpers - - - - -
+
+    def _trace_join(self, column_mapping: ColumnMapping) -> Dict[str, "Relationship"]:
+        """
+        Memoized `ColumnMapping.trace()`, the join paths only depend on the mapped relations and the schema.
+        
+        The cache is dropped whenever the database schema was reflected again (`Database.schema_version` changed).
+        """
+        if self._join_cache_version != self.db.schema_version:
+            self._join_cache.clear()
+            self._join_cache_version = self.db.schema_version
+
+        key = frozenset(column_mapping.paths)
+        joins = self._join_cache.get(key)
+        if joins is None:
+            joins = self._join_cache[key] = column_mapping.trace()
+        return joins
+
+    @property
+    def _insert_order(self) -> List[List[str]]:
+        """ Insertion order of all tables, computed once per schema version instead of on every insert. """
+        if self._insert_order_version != self.db.schema_version:
+            self._insert_order_cache = _insertion_levels(self.db.schema_graph())
+            self._insert_order_version = self.db.schema_version
+        return self._insert_order_cache
+
+    # - - - - - Insertion Helpers - - - - -
+
+    async def _insert_relation(self, connection, tmp_db_name: str, path: str, fields: List[Tuple[str, str]], children: List[Tuple[str, "Relationship"]], key: Optional["Column"]) -> None:
+        """
+        Set-based insertion (6.2) of a single relation path, all rows are handled by one statement instead of one lookup per row.
+
+        fields - (temporary column, target field) pairs mapped onto this relation
+        children - (child path, foreign key relationship) pairs, their keys were already joined to the temporary table
+        key - column the parent relation references, its value is joined back to the temporary table as `'<path>#<key>'`
+
+        Only rows which don't exist yet (compared by all given values) are inserted, existing rows are reused.
+        """
+        table = _quote_table(path.rpartition(self.seperator_rr)[2])
+
+        targets = [field for _, field in fields] + [relationship.source.name for _, relationship in children]
+        sources = [column for column, _ in fields] + [f"{child}#{relationship.target.name}" for child, relationship in children]
+        if not targets:
+            return
+
+        columns_sql = ", ".join(_quote(name) for name in targets)
+        select_sql = ", ".join(f"s.{_quote(name)}" for name in sources)
+        match_sql = " AND ".join(f"t.{_quote(target)} IS NOT DISTINCT FROM s.{_quote(source)}" for target, source in zip(targets, sources))
+
+        await connection.exec_driver_sql(
+            f"INSERT INTO {table} ({columns_sql}) "
+            f"SELECT DISTINCT {select_sql} FROM {tmp_db_name} AS s "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {table} AS t WHERE {match_sql}) "
+            f"ON CONFLICT DO NOTHING"
+        )
+
+        if key is None:
+            return
+
+        key_column = _quote(f"{path}#{key.name}")
+        await connection.exec_driver_sql(f"ALTER TABLE {tmp_db_name} ADD COLUMN {key_column} {key.data_type}")
+        await connection.exec_driver_sql(
+            f"UPDATE {tmp_db_name} AS s SET {key_column} = t.{_quote(key.name)} "
+            f"FROM {table} AS t WHERE {match_sql}"
+        )
+
     # - - - - - Core Insertion Function - CSV bytes → Temporary Table → into Final Tables - - - - -
 
     @staticmethod
@@ -69,56 +244,39 @@ class Schemanyd:
             If file path doesn't exist or has unsupported extension
         """
         
-        # Already a BytesIO - just ensure it's at the start
-        if isinstance(data, BytesIO):
-            data.seek(0)
-            return data
-            
-        # List of dictionaries
-        elif isinstance(data, list) and data and isinstance(data[0], dict):
-            return csv_from_dicts(data)
-            
-        # Polars DataFrame
-        elif hasattr(data, '__class__') and data.__class__.__name__ == 'DataFrame' and hasattr(data, 'write_csv'):
-            return csv_from_polars(data)
-            
-        # Pandas DataFrame
-        elif hasattr(data, '__class__') and data.__class__.__name__ == 'DataFrame' and hasattr(data, 'to_csv'):
-            return csv_from_pandas(data)
-            
-        # File path (string)
-        elif isinstance(data, str):
-            file_path = Path(data)
-            if not file_path.exists():
-                raise ValueError(f"File not found: {data}")
-                
-            suffix = file_path.suffix.lower()
-            if suffix == '.csv':
-                return csv_from_csv_file(data)
-            elif suffix in ['.xlsx', '.xls']:
-                return csv_from_excel_file(data)
-            else:
-                raise ValueError(f"Unsupported file extension: {suffix}. Supported: .csv, .xlsx, .xls")
-                
-        else:
-            raise TypeError(f"Unsupported data type: {type(data)}. "
-                          f"Supported types: list[dict], polars.DataFrame, pandas.DataFrame, "
-                          f"str (file path), BytesIO")
+        return _to_bytesio(data)
+
+    @staticmethod
+    def register_BytesIO_converter(data_type: type, converter: Callable[[Any], BytesIO]) -> None:
+        """ Let `to_BytesIO` (and `insert(..., try_convert=True)`) accept another data type, subclasses are covered as well. """
+        _to_bytesio.register(data_type, converter)
+
+    @staticmethod
+    def release_buffer(buffer: BytesIO) -> None:
+        """
+        Return a BytesIO created by `to_BytesIO` (or the csv_from_* / ipc_from_* helpers) once it was inserted.
 
-    async def insert(self, csv_file: BytesIO, column_mapping: Dict[str, str], has_header: bool = True, try_convert: bool = False) -> None:
+        The buffer is reused by the next conversion instead of allocating a new one, it must not be accessed afterwards.
+        """
+        release_buffer(buffer)
+
+    async def insert(self, csv_file: Union[BytesIO, pl.DataFrame, pd.DataFrame], column_mapping: Dict[str, str], has_header: bool = True, try_convert: bool = False, low_memory: Optional[bool] = None) -> None:
         """
         Insert data from a CSV BytesIO into the database using Schemanyd Autotrace Logic.
         
         Parameters
         ------------------------------------------------------------------------------------------------------------------------
-        csv_file: BytesIO
-            In-memory binary file-like object containing CSV data. The stream should contain UTF-8 encoded CSV bytes. 
+        csv_file: BytesIO | polars.DataFrame | pandas.DataFrame
+            In-memory binary file-like object containing CSV data. The stream should contain UTF-8 encoded CSV bytes or Arrow IPC bytes (see `ipc_from_dicts`). 
+            DataFrames are taken over directly, without being serialized to CSV and parsed again.
         column_mapping: Dict[str, str]
             A mapping of CSV column names to database table column names.
         has_header: bool
             Whether the CSV data has a header row. If this is False, please refer to the columns as "column_x" with x being a 1-based index.
         try_convert: bool
-            Whether to attempt automatic type conversion for the CSV data.
+            Whether to attempt automatic type conversion for the CSV data. A list[dict] or an Excel file path is converted to a DataFrame directly, a CSV file path is scanned lazily.
+        low_memory: bool | None
+            Whether to parse CSV data in low_memory mode. By default this is decided by the number of mapped columns, very wide inputs are parsed in fewer chunks to keep the allocations down.
 
         Example
         ------------------------------------------------------------------------------------------------------------------------
@@ -155,24 +313,7 @@ class Schemanyd:
         `/ = Schemanyd.seperator_rr(default)` - seperator between parent relation and relation (parent needs the foreign key)
         """
 
-        # 1. | Reading CSV from bytes (no disk I/O)
-
-        if try_convert and not isinstance(csv_file, BytesIO):
-            csv_file = Schemanyd.to_BytesIO(csv_file)
-
-        if not isinstance(csv_file, BytesIO):
-            raise TypeError("Expected csv_file to be a BytesIO object.")
-
-        csv_file.seek(0)
-        df = pl.read_csv(csv_file, has_header = has_header)
-
-        # 2. | 1st Check Wave
-        # 2.1. | Check if every mentioned column even exists within the csv (maybe check for similiar names / typos)
-
-        missing_columns = [col for col in column_mapping.keys() if col not in df.columns]
-        if missing_columns:
-            raise ValueError(f"Missing columns in CSV: {missing_columns}")
-
+        # 2. | 1st Check Wave (2.2. - 2.5. only depend on the database schema, they run before the CSV is read so the parser gets the target types)
         # 2.2. | Check if every mentioned database field even exists in the schema
         # 2.2.1. | Check if the data types match (maybe also check for similiar names / typos)
         # 2.3. | Check if fields which are mentioned without any long syntax ('.../...') have multiple foreign keys pointing to them
@@ -182,30 +323,101 @@ class Schemanyd:
         # 2.4.2. | If it would be possible, check if all entries already exist, or if I would need to add new (then this can't be done, but a dataset with the found values can be returned)
         # 2.5. | Check with a Graph Path-Tracing, if the join is possible, provide detailed feedback which exact point might cause issues
 
-        ColumnMapping(self, column_mapping).check()
+        mapping = ColumnMapping(self, column_mapping)
+        mapping.check()
+
+        # 1. | Reading CSV lazily from bytes (no disk I/O), in-memory frames skip the CSV round-trip entirely
+        # Only the mapped columns are materialized later on (projection pushdown, see 3.)
+        # CSV input is parsed with the types of the target columns, no schema inference pass is needed
+
+        schema_overrides = {csv_col: dtype_from_sql(column.data_type) for csv_col, column in zip(mapping.csv_cols, mapping.columns)}
+        if low_memory is None:
+            low_memory = low_memory_for(len(schema_overrides))  # only the mapped columns are parsed
+        suffix = Path(csv_file).suffix.lower() if isinstance(csv_file, str) else None
+
+        if isinstance(csv_file, pl.DataFrame):
+            lf = csv_file.lazy()
+        elif isinstance(csv_file, pd.DataFrame):
+            lf = frame_from_pandas(csv_file).lazy()
+        elif try_convert and isinstance(csv_file, list) and csv_file and isinstance(csv_file[0], dict):
+            lf = frame_from_dicts(csv_file).lazy()
+        elif try_convert and suffix in ['.xlsx', '.xls']:
+            lf = frame_from_excel_file(csv_file).lazy()
+        elif try_convert and suffix == '.csv':
+            lf = scan_from_csv_file(csv_file, has_header = has_header, schema_overrides = schema_overrides, low_memory = low_memory)
+        else:
+            if try_convert and not isinstance(csv_file, BytesIO):
+                csv_file = Schemanyd.to_BytesIO(csv_file)
+
+            if not isinstance(csv_file, BytesIO):
+                raise TypeError("Expected csv_file to be a BytesIO object or a DataFrame.")
 
-        # 3. | Renaming and dropping columns based on mapping
+            csv_file.seek(0)
+            if is_ipc(csv_file):  # Arrow IPC (see ipc_from_dicts) is already typed and columnar, it is read as is
+                lf = pl.read_ipc(csv_file, memory_map = False).lazy()
+            else:
+                lf = pl.scan_csv(csv_file, has_header = has_header, schema_overrides = schema_overrides, infer_schema = False, low_memory = low_memory)
+
+        # 2. | 1st Check Wave (continued)
+        # 2.1. | Check if every mentioned column even exists within the csv (maybe check for similiar names / typos)
 
-        df: pl.DataFrame = df.select(column_mapping.keys()).rename(column_mapping)
+        csv_columns = set(lf.collect_schema().names())  # only the header is read here
+        missing_columns = [col for col in column_mapping.keys() if col not in csv_columns]
+        if missing_columns:
+            raise ValueError(f"Missing columns in CSV: {missing_columns}")
 
-        # 4. | Creating a temporary table in the database
-        # 5. | Bulk loading CSV data into temp table
+        # 3. | Renaming and dropping columns based on mapping (unmapped columns are never parsed)
+        # Both are part of the lazy query, the collected frame only ever holds the mapped columns under their final names
+
+        df: pl.DataFrame = lf.select(list(column_mapping.keys())).rename(column_mapping).collect(engine="streaming")
+
+        # 4. | Creating a temporary table in the database, its columns are typed like the target columns (schema only, no rows are copied)
+        # 5. | Bulk loading CSV data into temp table, streamed chunk by chunk via COPY FROM STDIN
+        # Everything runs in a single transaction, the temporary table only exists on this connection and is dropped on commit
 
         tmp_db_name = f"tmp_{uuid.uuid4().hex}"
-        df.write_database(
-            table_name=tmp_db_name, 
-            connection=self.db.database_url.replace("+asyncpg", ""), 
-            if_table_exists="replace"
-        )
+        columns_sql = ", ".join(f"{_quote(name)} {column.data_type}" for name, column in zip(df.columns, mapping.columns))
+
+        async with self.db.engine.begin() as connection:
+            await connection.exec_driver_sql(f"CREATE TEMPORARY TABLE {tmp_db_name} ({columns_sql}) ON COMMIT DROP")
+            await self.db.copy_csv(connection, tmp_db_name, df.columns, csv_chunks(df))
+
+            # 6. | Schemanyd Logic
+
+                # 6.1. | Check which tables don't require any foreign keys and can immediately be inserted
+                # The foreign key depth of every table is precomputed per schema, here it is only filtered for the mapped tables
+
+            rr = self.seperator_rr
+            graph = self.db.graph
+            paths_by_table: Dict[str, List[str]] = {}  # keyed by the Graph table name, the same key _insert_order uses
+            for path in mapping.paths:
+                table = graph.get_table_by_name(path.rpartition(rr)[2], throw_error=True)
+                paths_by_table.setdefault(table.name, []).append(path)
+
+            levels = [[table for table in level if table in paths_by_table] for level in self._insert_order]
+            levels = [level for level in levels if level]
+
+                # 6.2. | Insert those and join the keys to the temporary table, continue with 6.1 again (maybe add an option for inserting as long as it can, even in cases where a join is not fully possible)
+                # Each relation path is one INSERT ... SELECT DISTINCT and one UPDATE ... FROM join, the parents find the keys of their children in the temporary table
 
-        # 6. | Schemanyd Logic
+            fields: Dict[str, List[Tuple[str, str]]] = {path: [] for path in mapping.paths}
+            for csv_col, path, field in zip(mapping.csv_cols, mapping.rel_paths, mapping.fields):
+                fields[path].append((column_mapping[csv_col], field))
 
-            # 6.1. | Check which tables don't require any foreign keys and can immediately be inserted
+            children: Dict[str, List[Tuple[str, "Relationship"]]] = {path: [] for path in mapping.paths}
+            for path, parent_path in mapping.paths.items():
+                if parent_path is not None:
+                    children[parent_path].append((path, mapping.joins[path]))
 
-            # 6.2. | Insert those and join the keys to the temporary table, continue with 6.1 again (maybe add an option for inserting as long as it can, even in cases where a join is not fully possible)
+            for level in levels:
+                # deeper paths first, so children of the same level (cyclic / self references) are joined before their parents
+                level_paths = sorted((path for table in level for path in paths_by_table[table]), key=lambda path: path.count(rr), reverse=True)
+                for path in level_paths:
+                    key = mapping.joins[path].target if mapping.paths[path] is not None else None
+                    await self._insert_relation(connection, tmp_db_name, path, fields[path], children[path], key)
 
-        # n-2. | Check if the insert was successful (not sure which logic to use for this yet)
+            # n-2. | Check if the insert was successful (not sure which logic to use for this yet)
 
-        # n-1. | Cleaning up temporary table
+        # n-1. | Cleaning up temporary table (done by ON COMMIT DROP)
 
         # n. | Return how the procedure went
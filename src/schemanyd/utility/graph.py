@@ -2,8 +2,13 @@
 # allowing for better encapsulation and manipulation of the graph structure.
 
 # Preinstalled Imports
-from email.policy import default
-from typing import Dict, List, Tuple, Type
+import sys
+from array import array
+from collections import defaultdict
+from functools import cached_property
+from itertools import product
+from typing import Any, Dict, List, Set, Tuple, Type
+from weakref import WeakKeyDictionary
 
 # SQLAlchemy Imports
 from sqlalchemy import ForeignKeyConstraint as SQLA_ForeignKeyConstraint
@@ -12,8 +17,8 @@ from sqlalchemy import UniqueConstraint as SQLA_UniqueConstraint
 from sqlalchemy import CheckConstraint as SQLA_CheckConstraint
 
 # Schemanyd Imports
-from .table_argument import TableArgument, Index, TableConstraint, ColumnConstraint, UniqueConstraint, PrimaryKeyConstraint, ForeignKeyConstraint, CheckConstraint, NotNullConstraint, DefaultConstraint
-from .repr.graph_visualization import draw_visualizations
+from .table_argument import TableArgument, Index, UniqueConstraint, PrimaryKeyConstraint, ForeignKeyConstraint, CheckConstraint, NotNullConstraint, DefaultConstraint
+from .repr.graph_visualizations import draw_visualizations
 
 def register_converters():
     """ Once the classes are defined, this function registers the available schema converters. """
@@ -24,6 +29,12 @@ def register_converters():
 class Graph:
 
     _SCHEMA_CONVERTERS: Dict[str, Type["SchemaConverter"]] = {}
+    _CONVERTER_INSTANCES: Dict[str, "SchemaConverter"] = {}  # converters are stateless, one instance per schema type is shared
+    _SORTED_TYPES: Tuple[str, ...] = ()  # registration happens once at import, the sorted names are kept
+
+    # schema → {schema type: (fingerprint, (nodes, edges))}, weakly keyed. The converted graph only holds plain values
+    # (names, type strings, default expressions as text), never SQLAlchemy objects, so it doesn't keep its schema alive
+    _BUILD_CACHE: "WeakKeyDictionary[Any, Dict[str, Tuple[Tuple, Tuple[List[Table], List[Relationship]]]]]" = WeakKeyDictionary()
 
 
     def __init__(self, schema, schema_type: str = "sqlalchemy"):
@@ -38,16 +49,108 @@ class Graph:
         self.schema = schema
         self.schema_type = schema_type
 
-        converter = self._load_converter(schema_type)
-        self.nodes, self.edges = converter.convert(schema)
+        # The schema type is validated right away, the conversion itself only runs once nodes / edges are accessed
+        self._converter = self._load_converter(schema_type)
+
+
+    @cached_property
+    def _converted(self) -> Tuple[List["Table"], List["Relationship"]]:
+        """ Converted nodes and edges, shared by all Graphs of the same schema object (see invalidate). """
+        try:
+            builds = self._BUILD_CACHE.setdefault(self.schema, {})
+        except TypeError:  # the schema object can't be weakly referenced, it is converted every time
+            return self._converter.convert(self.schema)
+
+        fingerprint = self._fingerprint(self.schema)
+        cached = builds.get(self.schema_type)
+        if cached is None or cached[0] != fingerprint:
+            cached = builds[self.schema_type] = (fingerprint, self._converter.convert(self.schema))
+        return cached[1]
+
+
+    @staticmethod
+    def _fingerprint(schema) -> Tuple:
+        """
+        Cheap content check of a cached conversion: every table key with its number of columns, constraints and indexes.
+
+        Catches tables, columns and constraints added or removed in place. Changes which keep all of these counts
+        (e.g. a column type altered in place) are not detected, call `Graph.invalidate(schema)` after those.
+        """
+        tables = getattr(schema, "tables", None)
+        if not tables:
+            return ()
+        return tuple(
+            (key, len(getattr(table, "columns", ())), len(getattr(table, "constraints", ())), len(getattr(table, "indexes", ())))
+            for key, table in tables.items()
+        )
+
+
+    @classmethod
+    def invalidate(cls, schema) -> None:
+        """ Drop the cached conversion of a schema, e.g. after its tables were changed in place. """
+        try:
+            cls._BUILD_CACHE.pop(schema, None)
+        except TypeError:
+            pass
+
+
+    @cached_property
+    def nodes(self) -> List["Table"]:
+        return self._converted[0]
+
+
+    @cached_property
+    def edges(self) -> List["Relationship"]:
+        return self._converted[1]
+
+
+    @cached_property
+    def _table_lookup(self) -> Dict[str, "Table"]:
+        return {table.name: table for table in self.nodes}
+
+
+    @cached_property
+    def adjacency(self) -> Dict[str, List[str]]:
+        """ Undirected adjacency of the table names (every relationship links both ways), built once from the edges. """
+        adjacency: Dict[str, List[str]] = defaultdict(list)
+        for edge in self.edges:
+            source, target = edge.source.table.name, edge.target.table.name
+            adjacency[source].append(target)
+            adjacency[target].append(source)
+        return {table.name: adjacency[table.name] for table in self.nodes}  # plain dict in node order, tables without edges included
+
+
+    @cached_property
+    def adjacency_csr(self) -> Tuple[Dict[str, int], List[str], array, array]:
+        """
+        The adjacency with integer table ids in CSR layout: (name → id, id → name, offsets, neighbors).
+
+        The neighbors of table `i` are `neighbors[offsets[i]:offsets[i + 1]]`, both arrays are flat and contiguous.
+        """
+        id_to_name = list(self.adjacency)
+        name_to_id = {name: index for index, name in enumerate(id_to_name)}
+
+        offsets = array("i", [0])
+        neighbors = array("i")
+        for name in id_to_name:
+            neighbors.extend(name_to_id[neighbor] for neighbor in self.adjacency[name])
+            offsets.append(len(neighbors))
+        return name_to_id, id_to_name, offsets, neighbors
 
 
     def __repr__(self):
         return f"Graph(nodes={self.nodes})"
     
 
+    def get_table_by_name(self, name: str, throw_error: bool = False) -> "Table":
+        table = self._table_lookup.get(name, None)
+        if throw_error and table is None:
+            raise ValueError(f"Table '{name}' not found in schema")
+        return table
+
+
     def draw_visualizations(self, types: List[str] = ["all"]) -> str:
-        """ Check repr/graph_visualization.py for available styles. """
+        """ Check repr/graph_visualizations.py for available styles. """
         return draw_visualizations(self, types)
 
 
@@ -55,16 +158,22 @@ class Graph:
     def register_converter(cls, schema_type: str, converter_cls: Type["SchemaConverter"]) -> None:
         """ Register a converter of type SchemaConverter for a specific schema type. """
         cls._SCHEMA_CONVERTERS[schema_type] = converter_cls
+        cls._SORTED_TYPES = tuple(sorted(cls._SCHEMA_CONVERTERS))
+        cls._CONVERTER_INSTANCES.pop(schema_type, None)  # a re-registered type gets a fresh instance
 
 
     @classmethod
     def get_supported_schema_types(cls) -> List[str]:
         """ Returns a sorted list of supported schema types. """
-        return sorted(cls._SCHEMA_CONVERTERS.keys())
+        return list(cls._SORTED_TYPES)
 
 
     def _load_converter(self, schema_type: str) -> "SchemaConverter":
         """ Try to load (return) the SchemaConverter object for the given schema type. """
+        converter = self._CONVERTER_INSTANCES.get(schema_type)
+        if converter is not None:
+            return converter
+
         try:
             converter_cls = self._SCHEMA_CONVERTERS[schema_type]
         except KeyError as exc:
@@ -72,13 +181,16 @@ class Graph:
             raise ValueError(
                 f"Error: Unsupported schema type '{schema_type}', available types are: [{available}]"
             ) from exc
-        return converter_cls()
+        converter = self._CONVERTER_INSTANCES[schema_type] = converter_cls()
+        return converter
 
 #  - - - - - GRAPH ELEMENTS - - - - -
 # - - - Table - - -
 
 class Table:  # Node
 
+    __slots__ = ("name", "columns", "relationships", "outgoing", "incoming", "arguments", "_relationship_keys", "_arg_ids")
+
     def __init__(self, name: str):
         """
         Table objects contain information about the table's columns, constraints and relationships.
@@ -88,7 +200,11 @@ class Table:  # Node
         self.name = name
         self.columns: Dict[str, "Column"] = {}
         self.relationships: List["Relationship"] = []
+        self.outgoing: List["Relationship"] = []  # relationships starting at this table (its foreign keys)
+        self.incoming: List["Relationship"] = []  # relationships pointing to this table, a self reference is in both
         self.arguments: List[TableArgument] = []
+        self._relationship_keys: Set[Tuple[int, int]] = set()  # (id(source), id(target)), one relationship per column pair
+        self._arg_ids: Set[int] = set()  # identity based membership of arguments, O(1) instead of a list scan
 
 
     def add_column(self, column: "Column") -> None:
@@ -103,12 +219,37 @@ class Table:  # Node
 
 
     def add_relationship(self, relationship: "Relationship") -> None:
-        if relationship not in self.relationships:
+        key = (id(relationship.source), id(relationship.target))
+        if key not in self._relationship_keys:
+            self._relationship_keys.add(key)
             self.relationships.append(relationship)
+            self._file_relationship(relationship)
+
+
+    def extend_relationships(self, relationships: List["Relationship"]) -> None:
+        """ Add several relationships at once, already known (source, target) pairs are skipped. """
+        keys = self._relationship_keys
+        new = []
+        for relationship in relationships:
+            key = (id(relationship.source), id(relationship.target))
+            if key not in keys:
+                keys.add(key)
+                new.append(relationship)
+                self._file_relationship(relationship)
+        self.relationships.extend(new)
+
+
+    def _file_relationship(self, relationship: "Relationship") -> None:
+        """ Partition by direction once when it is added, readers don't have to filter relationships by source / target. """
+        if relationship.source.table is self:
+            self.outgoing.append(relationship)
+        if relationship.target.table is self:
+            self.incoming.append(relationship)
 
 
     def add_argument(self, argument: TableArgument) -> None:
-        if argument not in self.arguments:  # this check might be unnecessary
+        if id(argument) not in self._arg_ids:  # this check might be unnecessary
+            self._arg_ids.add(id(argument))
             self.arguments.append(argument)
 
 
@@ -119,6 +260,8 @@ class Table:  # Node
 
 class Column:
 
+    __slots__ = ("table", "name", "data_type", "nullable", "default", "is_primary_key", "is_foreign_key", "arguments", "_arg_ids")
+
     def __init__(self, table: Table, name: str, data_type: str, nullable: bool = True, default: str = None, is_primary_key: bool = False, is_foreign_key: bool = False):
         """
         Column objects contain information about the column and the constraints associated with it.
@@ -133,10 +276,12 @@ class Column:
         self.is_primary_key = is_primary_key
         self.is_foreign_key = is_foreign_key
         self.arguments: List[TableArgument] = []  # not sure if necessary for schemanyd
+        self._arg_ids: Set[int] = set()
 
 
     def add_argument(self, argument: TableArgument) -> None:
-        if argument not in self.arguments:
+        if id(argument) not in self._arg_ids:
+            self._arg_ids.add(id(argument))
             self.arguments.append(argument)
 
 
@@ -155,6 +300,8 @@ class Column:
 
 class Relationship:  # Edge
 
+    __slots__ = ("source", "target", "_relationship_type")
+
     def __init__(self, source: Column, target: Column):
         """
         Relationship objects represent the connections between columns in different tables.
@@ -163,32 +310,62 @@ class Relationship:  # Edge
         """
         self.source = source
         self.target = target
-        self.relationship_type = self._determine_relationship_type()
+        self._relationship_type = None  # determined on first access, most traversals never read it
 
 
     def __repr__(self):
         return f"Relationship({self.source} -> {self.target})"
 
 
+    @property
+    def relationship_type(self) -> str:
+        if self._relationship_type is None:
+            self._relationship_type = self._determine_relationship_type()
+        return self._relationship_type
+
+
     def _determine_relationship_type(self):
-        if self.source.is_primary_key and self.target.is_foreign_key:
-            return "OneToMany"
-        elif self.source.is_foreign_key and self.target.is_primary_key:
-            return "ManyToOne"
-        elif self.source.is_foreign_key and self.target.is_foreign_key:
-            return "ManyToMany"
-        return "Unknown"
+        source, target = self.source, self.target
+        return _RELATIONSHIP_TYPES[(source.is_primary_key, source.is_foreign_key, target.is_primary_key, target.is_foreign_key)]
+
+
+# Relationship types, interned so they can also be compared by identity (`relationship.relationship_type is ONE_TO_MANY`)
+ONE_TO_MANY = sys.intern("OneToMany")
+MANY_TO_ONE = sys.intern("ManyToOne")
+MANY_TO_MANY = sys.intern("ManyToMany")
+UNKNOWN = sys.intern("Unknown")
+
+
+def _relationship_type_rule(source_pk: bool, source_fk: bool, target_pk: bool, target_fk: bool) -> str:
+    """ The relationship type rules, only evaluated once per flag combination to fill _RELATIONSHIP_TYPES. """
+    if source_pk and target_fk:
+        return ONE_TO_MANY
+    elif source_fk and target_pk:
+        return MANY_TO_ONE
+    elif source_fk and target_fk:
+        return MANY_TO_MANY
+    return UNKNOWN
+
+
+# (source PK, source FK, target PK, target FK) → relationship type, all 16 combinations
+_RELATIONSHIP_TYPES: Dict[Tuple[bool, bool, bool, bool], str] = {
+    flags: _relationship_type_rule(*flags) for flags in product((False, True), repeat=4)
+}
 
 # - - - - - - - - - - SCHEMA CONVERSION - - - - - - - - - - 
 
 class SchemaConverter:
-    
+
+    __slots__ = ()  # converters are stateless and shared per schema type
+
     def convert(self, schema) -> Tuple[List[Table], List[Relationship]]:
         raise NotImplementedError
 
 
 class SQLAlchemySchemaConverter(SchemaConverter):
 
+    __slots__ = ()
+
     def convert(self, metadata) -> Tuple[List[Table], List[Relationship]]:
         """
         Convert an SQLAlchemy MetaData object to a list of Schemanyd Table and Relationship objects.
@@ -202,134 +379,165 @@ class SQLAlchemySchemaConverter(SchemaConverter):
 
         # Mappings for tables and columns
         table_lookup: Dict[str, Table] = {}
+        type_cache: Dict[object, str] = {}  # type key → compiled type string, see _type_key
 
         # These are the final nodes and edges of the graph
         tables: List[Table] = []  # nodes
         relationships: List[Relationship] = []  # edges
 
-        # 1st Pass: Create Tables with Columns | without Relationships and Arguments (Constraints / Indexes)
+        # Foreign keys need the columns of tables which might not be created yet, they are resolved after the pass
+        pending_fks: List[Tuple[Table, List[Column], SQLA_ForeignKeyConstraint]] = []
+
+        # Single Pass: Create Tables with Columns and Arguments (Constraints / Indexes), Foreign Keys are only staged
         for table_name, sqla_table in metadata.tables.items():  # Iterate SQLAlchemy Table objects (and create Schemanyd Table objects)
             table_obj = Table(name=table_name)
             tables.append(table_obj)
-            table_lookup[table_name] = table_obj  # local lookup to get table objects by name | columns can be looked up by Table.get_column_by_name()
+            table_lookup[table_name] = table_obj
+
+            # Key columns are read once per table from its constraints instead of per column
+            pk_names = {col.name for col in sqla_table.primary_key.columns}
+            fk_names = {fk.parent.name for sqla_fk in sqla_table.foreign_key_constraints for fk in sqla_fk.elements}
 
             for sqla_column in sqla_table.columns:  # Iterate SQLAlchemy Column objects (and create Schemanyd Column objects)
 
+                type_key = self._type_key(sqla_column.type)
+                data_type = type_cache.get(type_key)
+                if data_type is None:
+                    data_type = type_cache[type_key] = str(sqla_column.type)
+
                 column_obj = Column(
                     table=table_obj,
                     name=sqla_column.name,
-                    data_type=str(sqla_column.type),
-                    is_primary_key=bool(sqla_column.primary_key),
-                    is_foreign_key=bool(sqla_column.foreign_keys),
+                    data_type=data_type,
+                    is_primary_key=sqla_column.name in pk_names,
+                    is_foreign_key=sqla_column.name in fk_names,
                 )
                 table_obj.add_column(column_obj)
 
                 # - - - - - Column-based Argument Conversion - - - - -
-                # The arguments won't be added to the columns here, but later all arguments (also those which might apply to multiple columns) will be added to their respective columns.
+                # Every argument is added to its table and to the column(s) it affects right away
                 # - - - NotNullConstraint - - -
                 if not sqla_column.nullable:
-                    table_obj.add_argument(NotNullConstraint(
+                    self._register_argument(table_obj, NotNullConstraint(
                         table=table_obj,
                         column=column_obj
-                    ))
+                    ), [column_obj])
 
                 # - - - DefaultConstraint - - -
                 if sqla_column.default is not None:
-                    table_obj.add_argument(DefaultConstraint(
+                    self._register_argument(table_obj, DefaultConstraint(
                         table=table_obj,
                         column=column_obj,
-                        default=sqla_column.default
-                    ))
-
-        # 2nd Pass: Inspect table objects again and create arguments (Foreign Keys needs the other Table Objects to be created, therefore this is done in a second round)
-        for table_name, sqla_table in metadata.tables.items():
+                        default_value=str(getattr(sqla_column.default, "arg", sqla_column.default))  # plain text, the ColumnDefault would reference the schema
+                    ), [column_obj])
 
-            table_obj = table_lookup.get(table_name)
+            table_columns = table_obj.columns  # bound once, columns are indexed directly (a missing one would be a broken schema, not a user error)
 
             # - - - - - Table-based Argument Conversion - - - - -
             # - - - Index - - -
             for sqla_index in sqla_table.indexes:
-                table_obj.add_argument(Index(
+                columns = [table_columns[col.name] for col in sqla_index.columns]
+                self._register_argument(table_obj, Index(
                     table=table_obj,
-                    columns=[table_obj.get_column_by_name(col.name) for col in sqla_index.columns],
+                    columns=columns,
                     name=sqla_index.name
-                ))
-                
+                ), columns)
+
             # - - - - - Constraints (Foreign Key, Primary Key, Unique, Check) - - - - -
             for sqla_constraint in sqla_table.constraints:
 
+                columns = [table_columns[col.name] for col in sqla_constraint.columns]
+
                 # - - - Foreign Key - - -
                 if isinstance(sqla_constraint, SQLA_ForeignKeyConstraint):
-                    
-                    referenced_table = table_lookup.get(sqla_constraint.referred_table.name)  # Get the referenced table
-                    referenced_columns = [referenced_table.get_column_by_name(fk.column.name) for fk in sqla_constraint.elements]  # Extract referenced columns from ForeignKey elements, each element is a ForeignKey object with a .column attribute pointing to the target column
-                    
-                    table_obj.add_argument(ForeignKeyConstraint(
-                        table=table_obj,
-                        columns=[table_obj.get_column_by_name(col.name) for col in sqla_constraint.columns],
-                        referenced_table=referenced_table,
-                        referenced_columns=referenced_columns,
-                        name=sqla_constraint.name
-                    ))
+
+                    # Checked before anything of the constraint is staged, a composite key (on either side) stops the conversion right here
+                    if len(sqla_constraint.columns) != 1 or len(sqla_constraint.elements) != 1:
+                        raise ValueError("Schemanyd is not able to handle composite foreign keys yet. Unfortunately, you would need to adjust your schema to utilize Schemanyd.")  # Maybe add a feature to ignore some tables and use Schemanyd on a subset of the database
+
+                    pending_fks.append((table_obj, columns, sqla_constraint))
 
                 # - - - Primary Key - - -
-                if isinstance(sqla_constraint, SQLA_PrimaryKeyConstraint):
-                    table_obj.add_argument(PrimaryKeyConstraint(  # Maybe implement a check later which prevents duplicate primary keys
+                elif isinstance(sqla_constraint, SQLA_PrimaryKeyConstraint):  # Maybe implement a check later which prevents duplicate primary keys
+                    self._register_argument(table_obj, PrimaryKeyConstraint(
                         table=table_obj,
-                        columns=[table_obj.get_column_by_name(col.name) for col in sqla_table.primary_key.columns],
+                        columns=columns,
                         name=sqla_table.primary_key.name
-                    ))
+                    ), columns)
 
                 # - - - Unique - - -
-                if isinstance(sqla_constraint, SQLA_UniqueConstraint):
-                    table_obj.add_argument(UniqueConstraint(
+                elif isinstance(sqla_constraint, SQLA_UniqueConstraint):
+                    self._register_argument(table_obj, UniqueConstraint(
                         table=table_obj,
-                        columns=[table_obj.get_column_by_name(col.name) for col in sqla_constraint.columns],
+                        columns=columns,
                         name=sqla_constraint.name
-                    ))
+                    ), columns)
 
                 # - - - Check - - -
-                if isinstance(sqla_constraint, SQLA_CheckConstraint):
-                    table_obj.add_argument(CheckConstraint(
+                elif isinstance(sqla_constraint, SQLA_CheckConstraint):
+                    self._register_argument(table_obj, CheckConstraint(
                         table=table_obj,
-                        columns=[table_obj.get_column_by_name(col.name) for col in sqla_constraint.columns],
-                        condition=sqla_constraint.expression,
+                        columns=columns,
+                        condition=str(sqla_constraint.sqltext),
                         name=sqla_constraint.name
-                    ))
-
-            # At the end of the second path, all table arguments have been added to their respective columns and will now be...
-            # ...added to the columns they affect
-            
-            for argument in table_obj.arguments:
-                if isinstance(argument, (Index, TableConstraint)):
-                    for col in argument.columns:
-                        col.add_argument(argument)
-                elif isinstance(argument, ColumnConstraint):
-                    argument.column.add_argument(argument)
-                else:
-                    print(f"Unhandled argument type: {type(argument)}")  # This should never be reached
-
-            # ...checked for relations to create Relationship Objects
-
-            for argument in table_obj.arguments:
-                
-                if not isinstance(argument, ForeignKeyConstraint):
-                    continue
-
-                if len(argument.columns) != 1 and len(argument.referenced_columns) != 1:
-                    raise ValueError("Schemanyd is not able to handle composite foreign keys yet. Unfortunately, you would need to adjust your schema to utilize Schemanyd.")  # Maybe add a feature to ignore some tables and use Schemanyd on a subset of the database
-
-                source_column = argument.table.get_column_by_name(argument.columns[0].name)
-                target_column = argument.referenced_table.get_column_by_name(argument.referenced_columns[0].name)
-
-                # Create the Relationship from the local (source) to the referenced (target) column
-                relationship = Relationship(source=source_column, target=target_column)
+                    ), columns)
+
+        # Resolve the staged Foreign Keys, every table exists now
+        rel_cache: Dict[Tuple[int, int], Relationship] = {}  # (id(source), id(target)) → the one Relationship of that column pair
+        table_relationships: Dict[Table, List[Relationship]] = defaultdict(list)  # wired up in one batch per table below
+        for table_obj, columns, sqla_constraint in pending_fks:
+
+            referenced_name = sqla_constraint.referred_table.key  # same key as in metadata.tables (schema-qualified if needed)
+            referenced_table = table_lookup.get(referenced_name)  # Get the referenced table
+            referenced_columns = [referenced_table.columns[fk.column.name] for fk in sqla_constraint.elements]  # Each element is a ForeignKey object with a .column attribute pointing to the target column
+
+            argument = ForeignKeyConstraint(
+                table=table_obj,
+                columns=columns,
+                referenced_table=referenced_table,
+                referenced_columns=referenced_columns,
+                name=sqla_constraint.name
+            )
+            self._register_argument(table_obj, argument, columns)
+
+            # ...and the Relationship from the local (source) to the referenced (target) column
+            source_column = columns[0]
+            target_column = referenced_columns[0]
+
+            key = (id(source_column), id(target_column))
+            relationship = rel_cache.get(key)
+            if relationship is None:  # duplicate constraints on the same column pair share one edge
+                relationship = rel_cache[key] = Relationship(source=source_column, target=target_column)
                 relationships.append(relationship)
-                source_column.table.add_relationship(relationship)
-                target_column.table.add_relationship(relationship)
+            table_relationships[source_column.table].append(relationship)
+            table_relationships[target_column.table].append(relationship)
+
+        for table_obj, table_rels in table_relationships.items():
+            table_obj.extend_relationships(table_rels)
 
         return tables, relationships
 
+
+    @staticmethod
+    def _type_key(sqla_type) -> object:
+        """
+        Cache key of a column type's string: the type class for types without any parameters (e.g. every `INTEGER()`
+        compiles to the same string, even if reflection created a separate instance per column), else the instance itself.
+
+        The instances live as long as the metadata, so their ids stay unique during the conversion.
+        """
+        if not getattr(sqla_type, "__dict__", True):
+            return type(sqla_type)
+        return id(sqla_type)
+
+
+    @staticmethod
+    def _register_argument(table_obj: Table, argument: TableArgument, columns: List[Column]) -> None:
+        """ Add the argument to its table and to every column it affects. """
+        table_obj.add_argument(argument)
+        for column in columns:
+            column.add_argument(argument)
+
 # - - - - - REGISTER CONVERTERS - - - - -
 
 register_converters()
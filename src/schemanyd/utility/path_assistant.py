@@ -1,5 +1,3 @@
-from collections import deque
-
 from schemanyd.schemanyd import Schemanyd
 
 class PathAssistant:
@@ -15,47 +13,93 @@ class PathAssistant:
         self.seperator_rf = schemanyd.seperator_rf
         self.seperator_rr = schemanyd.seperator_rr
 
-        self.all_tables = set(self.schema.tables.keys())
+        # Materialized once, immutable structures for O(1) membership and cheap neighbor iteration
+        self.all_tables = frozenset(self.schema.tables.keys())
+        self._table_paths = {name: getattr(table, "fullname", name) for name, table in self.schema.tables.items()}
+        self._name_to_id, self._id_to_name, self._offsets, self._neighbors = self.graph.adjacency_csr
 
 
-    async def find_join_path(self, required_tables):
-        missing_tables = [table for table in required_tables if table not in self.all_tables]
-        if missing_tables:
-            print(f"Error: The following required tables were not found in the schema: {missing_tables}")
-            return None
+    def find_join_path(self, required_tables):
+        """
+        Raises a ValueError if any of the required tables is not part of the schema
+        """
+        if not self.all_tables.issuperset(required_tables):  # C-level check, the missing tables are only collected on failure
+            missing_tables = sorted(frozenset(required_tables).difference(self.all_tables))
+            raise ValueError(f"Required tables not found in schema: {missing_tables}")
 
 
-    async def get_table_path(self, table_name: str) -> str:
+    def get_table_path(self, table_name: str) -> str:
         """
-        
+        Full (schema-qualified) name of a table, precomputed in __init__
         """
-        table_info = self.schema.get(table_name)
-        if not table_info:
+        table_path = self._table_paths.get(table_name)
+        if table_path is None:
             raise ValueError(f"Table '{table_name}' not found in schema.")
-        return table_info.get("path", "")
+        return table_path
     
 
     def find_shortest_path(self, start, end):
         """
-        Breadth First Search AlgorithmFind the shortest path between start and end using BFS
+        Bidirectional Breadth First Search, find the shortest path between start and end.
+
+        Both ends are searched level by level (always the smaller frontier), until they meet in the middle.
+        Joins can be followed in both directions, so the backward search uses the same adjacency.
+        The search runs on the integer table ids of the CSR adjacency, only the result is translated back to names.
         """
         if start == end:
             return [start]
-        
-        queue = deque([(start, [start])])
-        visited = {start}
-        
-        while queue:
-            node, path = queue.popleft()
-            
-            for neighbor in self.graph[node]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    new_path = path + [neighbor]
-                    
-                    if neighbor == end:
-                        return new_path
-                    
-                    queue.append((neighbor, new_path))
-        
+
+        name_to_id = self._name_to_id
+        if start not in name_to_id or end not in name_to_id:
+            return None
+
+        size = len(self._id_to_name)
+        seen = bytearray(size)  # bit 1: reached from start, bit 2: reached from end
+        predecessors = ([-1] * size, [-1] * size)  # per side, -1 marks the side's origin
+
+        start_id, end_id = name_to_id[start], name_to_id[end]
+        seen[start_id], seen[end_id] = 1, 2
+        frontiers = [[start_id], [end_id]]
+        expand = self._expand_frontier  # bound once, the loop body only works on locals
+
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            meet, frontiers[side] = expand(frontiers[side], side, seen, predecessors[side])
+
+            if meet >= 0:
+                forward, backward = predecessors
+                path = []
+                node = meet
+                while node >= 0:  # meet → start
+                    path.append(node)
+                    node = forward[node]
+                path.reverse()
+                node = backward[meet]
+                while node >= 0:  # meet → end
+                    path.append(node)
+                    node = backward[node]
+                return [self._id_to_name[node] for node in path]
+
         return None
+
+
+    def _expand_frontier(self, frontier, side, seen, predecessors):
+        """
+        Expand the frontier of one side (0 = start, 1 = end) by one level, returns (meeting node id or -1, next frontier)
+        """
+        offsets, neighbors = self._offsets, self._neighbors  # locals instead of attribute lookups in the tight loop
+        mark, other = 1 << side, 2 >> side
+        next_frontier = []
+        append = next_frontier.append
+
+        for node in frontier:
+            for neighbor in neighbors[offsets[node]:offsets[node + 1]]:
+                flags = seen[neighbor]
+                if not flags & mark:
+                    seen[neighbor] = flags | mark
+                    predecessors[neighbor] = node
+                    if flags & other:
+                        return neighbor, next_frontier
+                    append(neighbor)
+
+        return -1, next_frontier
@@ -0,0 +1,197 @@
+"""
+Integer kernels of the graph visualizations.
+
+The traversals work on table ids (0..n-1) and plain int lists, the index in graph_visualizations translates between
+ids and table names. Imported on first use, so importing schemanyd doesn't load them when no visualization is drawn.
+"""
+from typing import List
+
+
+# Up to this many tables every adjacency row is held as one int bitmask (bit v set: edge to table v)
+BITSET_MAX_TABLES = 1024
+
+
+def tarjan_bitset(out_ids: List[List[int]]) -> List[List[int]]:
+    """
+    Iterative Tarjan on bitmask rows, the children of a table are taken lowest bit first and the tables on the
+    stack are a mask as well, so the back edge test is a single AND. Returns the components in completion order.
+    """
+    n = len(out_ids)
+    adj = [0] * n
+    for node, targets in enumerate(out_ids):
+        row = 0
+        for target in targets:
+            row |= 1 << target
+        adj[node] = row
+
+    index = [-1] * n  # discovery order, -1 while unvisited
+    low = [0] * n
+    on_stack = 0
+    stack: List[int] = []
+    counter = 0
+    components: List[List[int]] = []
+
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack |= 1 << root
+        work = [[root, adj[root]]]  # DFS frames: table and the mask of its children not looked at yet
+
+        while work:
+            frame = work[-1]
+            node, pending = frame
+            while pending:
+                bit = pending & -pending
+                pending ^= bit
+                child = bit.bit_length() - 1
+                if index[child] < 0:  # descend, the frame is resumed once the child is done
+                    frame[1] = pending
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack |= bit
+                    work.append([child, adj[child]])
+                    break
+                if on_stack & bit and index[child] < low[node]:
+                    low[node] = index[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == index[node]:  # node is the root of a component, pop its members
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack ^= 1 << member
+                        members.append(member)
+                        if member == node:
+                            break
+                    members.reverse()
+                    components.append(members)
+
+    return components
+
+
+def tarjan_lists(out_ids: List[List[int]]) -> List[List[int]]:
+    """Iterative Tarjan on successor lists, for schemas too large for bitmask rows. Returns the components in completion order."""
+    n = len(out_ids)
+    index = [-1] * n  # discovery order, -1 while unvisited
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack: List[int] = []
+    counter = 0
+    components: List[List[int]] = []
+
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(out_ids[root]))]  # DFS frames: table and the iterator over its remaining children
+
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if index[child] < 0:  # descend, the frame is resumed once the child is done
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = 1
+                    work.append((child, iter(out_ids[child])))
+                    break
+                if on_stack[child] and index[child] < low[node]:
+                    low[node] = index[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == index[node]:  # node is the root of a component, pop its members
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        members.append(member)
+                        if member == node:
+                            break
+                    members.reverse()
+                    components.append(members)
+
+    return components
+
+
+def distances_to(in_ids: List[List[int]], end: int, max_depth: int) -> List[int]:
+    """Reverse BFS from end (over in_ids), the number of steps every table needs at least to reach end (max_depth + 1: out of reach)."""
+    distance = [max_depth + 1] * len(in_ids)
+    distance[end] = 0
+    frontier = [end]
+    for steps in range(1, max_depth + 1):
+        next_frontier = []
+        for node in frontier:
+            for source in in_ids[node]:
+                if distance[source] > steps:
+                    distance[source] = steps
+                    next_frontier.append(source)
+        frontier = next_frontier
+    return distance
+
+
+def paths_between(out_ids: List[List[int]], in_ids: List[List[int]], start: int, end: int, max_depth: int, max_paths: int) -> List[List[int]]:
+    """
+    The first max_paths simple paths from start to end (at most max_depth edges), in DFS order. Tables from which end
+    can't be reached with the remaining depth (reverse BFS distances) are never entered.
+    """
+    paths: List[List[int]] = []
+    distance = distances_to(in_ids, end, max_depth)
+    if distance[start] > max_depth:  # end is out of reach, nothing to enumerate
+        return paths
+
+    path = [start]
+    on_path = bytearray(len(out_ids))  # flag per table id, set while the table is on the current path
+    on_path[start] = 1
+    stack = [iter(out_ids[start])]  # explicit DFS frames (the child iterator of each path entry), no recursion limit
+
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            on_path[path.pop()] = 0
+        elif len(path) > max_depth:
+            continue
+        elif child == end:
+            paths.append(path + [child])
+            if len(paths) == max_paths:  # only these are shown
+                break
+        elif not on_path[child] and distance[child] <= max_depth - len(path):  # end still in reach
+            path.append(child)
+            on_path[child] = 1
+            stack.append(iter(out_ids[child]))
+
+    return paths
+
+
+def is_acyclic(out_ids: List[List[int]], in_ids: List[List[int]]) -> bool:
+    """Kahn's algorithm, True if no table lies on a cycle (self references included). Cheaper than Tarjan, no DFS frames."""
+    remaining = [len(sources) for sources in in_ids]  # edges into each table not removed yet
+    ready = [node for node, count in enumerate(remaining) if not count]
+    removed = 0
+    while ready:
+        node = ready.pop()
+        removed += 1
+        for target in out_ids[node]:
+            remaining[target] -= 1
+            if not remaining[target]:
+                ready.append(target)
+    return removed == len(out_ids)
@@ -1,5 +1,10 @@
-from typing import List, Set, Dict, Tuple, TYPE_CHECKING, Any
-from collections import deque
+from typing import List, Set, Dict, Tuple, TYPE_CHECKING, Any, Callable, FrozenSet, Optional
+from collections import Counter, deque
+from functools import lru_cache
+from io import StringIO
+from weakref import WeakKeyDictionary
+
+from ..table_argument import ForeignKeyConstraint, Index
 
 # Avoid circular imports: only import graph types for type checking.
 if TYPE_CHECKING:
@@ -10,6 +15,29 @@ else:
     Table = Any  # type: ignore
     Relationship = Any  # type: ignore
 
+# Fixed lines of the detailed style, built once (with the leading newline they are written with)
+_D_LINE = "═" * 58
+_D_TOP = f"\n╔{_D_LINE}╗"
+_D_MID = f"\n╠{_D_LINE}╣"
+_D_BOT = f"\n╚{_D_LINE}╝"
+_D_BLANK = f"\n║{' ' * 58}║"
+_D_COLUMNS = f"\n║ COLUMNS:{' ' * 50}║"
+_D_CONSTRAINTS = f"\n║ CONSTRAINTS:{' ' * 46}║"
+
+# Put in front of and between the rendered styles of draw_visualizations
+_STYLE_SEPARATOR = "\n\n" + "=" * 80 + "\n\n"
+
+# The styles write into a StringIO, every line with its leading newline (the layout of a "\n".join of the lines)
+
+# Header underline of every style, the title is written in front of it
+_HEADER_RULE = "\n" + "=" * 60 + "\n"
+_TABLE_RULE = "\n" + "─" * 70  # below the column titles of the tabular styles
+
+# Row templates of the tabular styles (with their leading newline), the format specs are parsed once instead of per row
+_ROW_COMPACT = "\n{:<30} │ {:>2} cols │ {:>2} rels".format
+_ROW_PK = "\n🔹 {:<30} │ {:<10} │ {}".format
+_ROW_NO_PK = "\n❌ {:<30} │ No PK".format
+
 # DISCLAIMER
 # These visualizations were created by AI and may not be accurate in all cases. Please keep that in mind.
 
@@ -28,7 +56,9 @@ def draw_visualizations(graph: Graph, style: List[str]) -> str:
         -----------------
         
         **All**
-        - Use ["all"] to apply all available styles in a stable order.
+        - Use ["all"] to apply all available styles in a stable order, except the path enumerations
+          ("full_paths", "path_finder") which can grow exponentially with the schema.
+        - Use ["all+paths"] to apply really all styles.
 
         **Basic Styles:**
         
@@ -94,503 +124,654 @@ def draw_visualizations(graph: Graph, style: List[str]) -> str:
     if not style:
         style = ["simple"]
 
-    # Supported styles in a stable order. Keep this list in sync with the handlers below.
-    supported_styles = [
-        "simple", "detailed", "compact", "relations", "hierarchy", "dependency_chain",
-        "bidirectional", "explorer", "full_paths", "depth_first", "breadth_first",
-        "stats", "complexity", "centrality", "isolated", "ascii_graph", "tree",
-        "boxed", "mermaid", "constraints", "indexes", "primary_keys", "foreign_keys",
-        "circular_deps", "orphans", "network_map", "path_finder",
-    ]
-
     # If "all" is requested, expand to all supported styles (preserve order and dedupe)
-    requested = []
-    if "all" in style:
-        for s in supported_styles:
-            if s not in requested:
-                requested.append(s)
-    else:
-        for s in style:
-            if s not in requested:
-                requested.append(s)
+    if "all+paths" in style:
+        style = STYLE_HANDLERS
+    elif "all" in style:
+        style = _CHEAP_STYLES
 
+    handlers, parts = _make_dispatcher(tuple(dict.fromkeys(style)))
+
+    # Materialized once, the styles read the nodes and edges from the shared index
+    nodes, edges = tuple(graph.nodes), tuple(graph.edges)
+    if not nodes:
+        return _STYLE_SEPARATOR + "(empty graph)"
+
+    idx = _graph_index(graph, nodes, edges, parts)  # shared by all styles, only with the parts they read
     outputs = []
     
-    for s in requested:
-        if s == "simple":
-            outputs.append(_style_simple(graph))
-        elif s == "detailed":
-            outputs.append(_style_detailed(graph))
-        elif s == "compact":
-            outputs.append(_style_compact(graph))
-        elif s == "relations":
-            outputs.append(_style_relations(graph))
-        elif s == "hierarchy":
-            outputs.append(_style_hierarchy(graph))
-        elif s == "dependency_chain":
-            outputs.append(_style_dependency_chain(graph))
-        elif s == "bidirectional":
-            outputs.append(_style_bidirectional(graph))
-        elif s == "explorer":
-            outputs.append(_style_explorer(graph))
-        elif s == "full_paths":
-            outputs.append(_style_full_paths(graph))
-        elif s == "depth_first":
-            outputs.append(_style_depth_first(graph))
-        elif s == "breadth_first":
-            outputs.append(_style_breadth_first(graph))
-        elif s == "stats":
-            outputs.append(_style_stats(graph))
-        elif s == "complexity":
-            outputs.append(_style_complexity(graph))
-        elif s == "centrality":
-            outputs.append(_style_centrality(graph))
-        elif s == "isolated":
-            outputs.append(_style_isolated(graph))
-        elif s == "ascii_graph":
-            outputs.append(_style_ascii_graph(graph))
-        elif s == "tree":
-            outputs.append(_style_tree(graph))
-        elif s == "boxed":
-            outputs.append(_style_boxed(graph))
-        elif s == "mermaid":
-            outputs.append(_style_mermaid(graph))
-        elif s == "constraints":
-            outputs.append(_style_constraints(graph))
-        elif s == "indexes":
-            outputs.append(_style_indexes(graph))
-        elif s == "primary_keys":
-            outputs.append(_style_primary_keys(graph))
-        elif s == "foreign_keys":
-            outputs.append(_style_foreign_keys(graph))
-        elif s == "circular_deps":
-            outputs.append(_style_circular_deps(graph))
-        elif s == "orphans":
-            outputs.append(_style_orphans(graph))
-        elif s == "network_map":
-            outputs.append(_style_network_map(graph))
-        elif s == "path_finder":
-            outputs.append(_style_path_finder(graph))
-        else:
+    for s, handler in handlers:
+        if handler is None:
             outputs.append(f"Unknown style: {s}")
-    
-    return "\n\n" + "="*80 + "\n\n".join(outputs)
+        elif s in _TOPOLOGY_STYLES:  # rendered once per index (same names and edges)
+            rendered = idx.rendered.get(s)
+            if rendered is None:
+                rendered = idx.rendered[s] = handler(graph, idx)
+            outputs.append(rendered)
+        else:
+            outputs.append(handler(graph, idx))
+    
+    return _STYLE_SEPARATOR + _STYLE_SEPARATOR.join(outputs)
+
+
+# ==================== SHARED INDEX ====================
+
+# Optional parts of the index and the styles reading them, all other styles only need the adjacency
+_INDEX_PARTS: Dict[str, Tuple[str, ...]] = {
+    "detailed": ("columns",),
+    "primary_keys": ("columns",),
+    "complexity": ("complexity",),
+    "circular_deps": ("sccs",),
+    "dependency_chain": ("sccs",),
+}
+_ALL_INDEX_PARTS = frozenset(part for parts in _INDEX_PARTS.values() for part in parts)
+
+# Styles only reading the table names and the adjacency (the costly traversals), their output is kept on the index
+_TOPOLOGY_STYLES = frozenset({"full_paths", "circular_deps", "network_map", "path_finder"})
+
+_INDEX_CACHE: "WeakKeyDictionary[Any, _GraphIndex]" = WeakKeyDictionary()  # graph → its index, see _graph_index
+
+class _GraphIndex:
+    """Adjacency of the graph by table name, the styles iterate these lists instead of filtering table.relationships."""
+
+    __slots__ = (
+        "nodes", "edges", "parts", "name_to_table", "names", "table_id", "out_ids", "in_ids", "out_adj", "out_via", "in_adj", "in_via", "out_deg", "in_deg", "total_deg",
+        "complexity_score", "complexity_rows", "edge_rows", "paths_cache", "pk_cols", "fk_cols", "col_rendered",
+        "scc_id", "scc_members", "in_cycle", "fingerprint", "rendered",
+    )
+
+    def __init__(self):
+        self.nodes: Tuple[Table, ...] = ()
+        self.edges: Tuple[Relationship, ...] = ()
+        self.parts: FrozenSet[str] = frozenset()  # optional parts built so far
+        self.name_to_table: Dict[str, Table] = {}
+        self.names: List[str] = []               # table id → name (node order), the traversals work on these ids
+        self.table_id: Dict[str, int] = {}       # name → table id
+        self.out_ids: List[List[int]] = []       # out_adj by table id
+        self.in_ids: List[List[int]] = []        # in_adj by table id
+        self.out_adj: Dict[str, List[str]] = {}  # table → referenced tables
+        self.out_via: Dict[str, List[str]] = {}  # table → referencing column, parallel to out_adj
+        self.in_adj: Dict[str, List[str]] = {}   # table → referencing tables
+        self.in_via: Dict[str, List[str]] = {}   # table → referencing column, parallel to in_adj
+        self.out_deg: Dict[str, int] = {}
+        self.in_deg: Dict[str, int] = {}
+        self.total_deg: Dict[str, int] = {}
+        self.complexity_score: Dict[str, float] = {}
+        self.complexity_rows: List[Tuple[str, float, int, int, int]] = []  # (name, score, cols, rels, constraints)
+        self.edge_rows: List[Tuple[str, str, str, str]] = []  # (source table, target table, source column, relationship type)
+        self.paths_cache: Dict[Tuple[str, int, int], Tuple[List[List[str]], int]] = {}  # see _bounded_paths
+        self.pk_cols: Dict[str, Tuple[str, ...]] = {}       # table → primary key column names
+        self.fk_cols: Dict[str, Tuple[str, ...]] = {}       # table → foreign key column names
+        self.col_rendered: Dict[str, str] = {}              # table → column rows of the detailed style
+        self.scc_id: Dict[str, int] = {}                    # table → its strongly connected component
+        self.scc_members: Dict[int, List[str]] = {}         # component → its tables (in discovery order)
+        self.in_cycle: Set[str] = set()                     # tables on a cycle (component of 2+ tables or self reference)
+        self.fingerprint: Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]] = ((), ())  # see _fingerprint
+        self.rendered: Dict[str, str] = {}                  # style → output, for the _TOPOLOGY_STYLES
+
+
+def _build_index(nodes: Tuple[Table, ...], edges: Tuple[Relationship, ...], parts: FrozenSet[str] = _ALL_INDEX_PARTS) -> _GraphIndex:
+    """
+    Single pass over the edges, every table of nodes gets an entry (empty lists if unconnected).
+
+    The adjacency and degrees are always built, the optional parts ("columns", "complexity", "sccs") only if requested.
+    """
+    idx = _GraphIndex()
+    idx.nodes, idx.edges = nodes, edges
+    idx.name_to_table = {table.name: table for table in idx.nodes}
+    for attr in ("out_adj", "out_via", "in_adj", "in_via"):
+        setattr(idx, attr, {name: [] for name in idx.name_to_table})
+
+    out_adj, out_via, in_adj, in_via = idx.out_adj, idx.out_via, idx.in_adj, idx.in_via
+    edge_rows = idx.edge_rows
+    for rel in idx.edges:
+        source, target, via = rel.source.table.name, rel.target.table.name, rel.source.name
+        edge_rows.append((source, target, via, rel.relationship_type))
+        out_adj[source].append(target)
+        out_via[source].append(via)
+        in_adj[target].append(source)
+        in_via[target].append(via)
+
+    idx.fingerprint = (tuple(idx.name_to_table), tuple((source, target) for source, target, _, _ in edge_rows))
+    idx.names = names = list(idx.name_to_table)
+    idx.table_id = table_id = {name: i for i, name in enumerate(names)}
+    idx.out_ids = [[table_id[target] for target in out_adj[name]] for name in names]
+    idx.in_ids = [[table_id[source] for source in in_adj[name]] for name in names]
+
+    idx.out_deg = {name: len(targets) for name, targets in out_adj.items()}
+    idx.in_deg = {name: len(sources) for name, sources in in_adj.items()}
+    idx.total_deg = {name: idx.out_deg[name] + idx.in_deg[name] for name in idx.name_to_table}
+
+    _add_index_parts(idx, parts)
+    return idx
+
+
+def _add_index_parts(idx: _GraphIndex, parts: FrozenSet[str]) -> None:
+    """Build the optional parts the index doesn't have yet."""
+    missing = parts - idx.parts
+    if "columns" in missing:
+        _index_columns(idx)
+    if "complexity" in missing:
+        _index_complexity(idx)
+    if "sccs" in missing:
+        _compute_sccs(idx)
+    idx.parts = idx.parts | missing
+
+
+def _graph_index(graph: Graph, nodes: Tuple[Table, ...], edges: Tuple[Relationship, ...], parts: FrozenSet[str]) -> _GraphIndex:
+    """
+    Shared index of a graph, reused across draw_visualizations calls while the graph has the same nodes and edges
+    and none of them was renamed or pointed elsewhere in place (checked against the fingerprint).
+
+    The cache holds the graphs weakly, an index never keeps its graph alive.
+    """
+    try:
+        idx = _INDEX_CACHE.get(graph)
+    except TypeError:  # the graph can't be weakly referenced, nothing is cached
+        return _build_index(nodes, edges, parts)
+
+    if idx is None or idx.nodes != nodes or idx.edges != edges or idx.fingerprint != _fingerprint(nodes, edges):
+        idx = _INDEX_CACHE[graph] = _build_index(nodes, edges, parts)
+    else:
+        _add_index_parts(idx, parts)
+    return idx
+
+
+def _fingerprint(nodes: Tuple[Table, ...], edges: Tuple[Relationship, ...]) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """Table names and (source, target) table names of the edges, everything the topology of the index is built from."""
+    return (
+        tuple({table.name: None for table in nodes}),
+        tuple((rel.source.table.name, rel.target.table.name) for rel in edges),
+    )
+
+
+def _index_columns(idx: _GraphIndex) -> None:
+    """One pass over the columns of every table for all column based styles, fills pk_cols, fk_cols and col_rendered."""
+    for table in idx.nodes:
+        pk_cols, fk_cols, rows = [], [], []
+        for col in table.columns.values():
+            if col.is_primary_key:
+                pk_cols.append(col.name)
+            if col.is_foreign_key:
+                fk_cols.append(col.name)
+            pk = "🔑" if col.is_primary_key else "  "
+            fk = "🔗" if col.is_foreign_key else "  "
+            null = "✓" if col.nullable else "✗"
+            rows.append(f"\n║   {pk}{fk} {col.name:<20} {col.data_type:<15} NULL:{null} ║")
+        idx.pk_cols[table.name] = tuple(pk_cols)
+        idx.fk_cols[table.name] = tuple(fk_cols)
+        idx.col_rendered[table.name] = "".join(rows)
+
+
+def _index_complexity(idx: _GraphIndex) -> None:
+    """Complexity score and row of every table."""
+    for table in idx.nodes:
+        cols, rels, constraints = len(table.columns), len(table.relationships), len(table.arguments)
+        score = cols * 1 + rels * 2 + constraints * 1.5
+        idx.complexity_score[table.name] = score
+        idx.complexity_rows.append((table.name, score, cols, rels, constraints))
+
+
+def _compute_sccs(idx: _GraphIndex) -> None:
+    """Strongly connected components of the graph, fills scc_id, scc_members and in_cycle."""
+    from ._graph_kernels import BITSET_MAX_TABLES, is_acyclic, tarjan_bitset, tarjan_lists
+
+    names, out_ids = idx.names, idx.out_ids
+    if is_acyclic(out_ids, idx.in_ids):  # the common case, every table is a component of its own and nothing is on a cycle
+        components = [[i] for i in range(len(names))]
+    elif len(names) <= BITSET_MAX_TABLES:
+        components = tarjan_bitset(out_ids)
+    else:
+        components = tarjan_lists([sorted(set(targets)) for targets in out_ids])  # same child order as the bitset walk
+
+    for component, ids in enumerate(components):
+        members = [names[i] for i in ids]
+        for member in members:
+            idx.scc_id[member] = component
+        idx.scc_members[component] = members
+        if len(ids) > 1 or ids[0] in out_ids[ids[0]]:  # a self referencing table is a cycle of its own
+            idx.in_cycle.update(members)
 
 
 # ==================== BASIC STYLES ====================
 
-def _style_simple(graph: Graph) -> str:
+def _style_simple(graph: Graph, idx: _GraphIndex) -> str:
     """Simple list of tables and their relationships."""
-    lines = ["📊 SIMPLE DATABASE OVERVIEW", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("📊 SIMPLE DATABASE OVERVIEW")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
-        lines.append(f"📋 Table: {table.name}")
-        lines.append(f"   Columns: {len(table.columns)}")
+    for table in idx.nodes:
+        w(f"\n📋 Table: {table.name}")
+        w(f"\n   Columns: {len(table.columns)}")
         
         if table.relationships:
-            lines.append(f"   Relationships:")
-            for rel in table.relationships:
-                if rel.source.table == table:
-                    lines.append(f"      → {rel.target.table.name} (via {rel.source.name})")
-        lines.append("")
+            w(f"\n   Relationships:")
+            for target, via in zip(idx.out_adj[table.name], idx.out_via[table.name]):
+                w(f"\n      → {target} (via {via})")
+        w("\n")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_detailed(graph: Graph) -> str:
+def _style_detailed(graph: Graph, idx: _GraphIndex) -> str:
     """Detailed view with columns, types, and constraints."""
-    lines = ["📚 DETAILED DATABASE STRUCTURE", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("📚 DETAILED DATABASE STRUCTURE")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
-        lines.append(f"╔{'═' * 58}╗")
-        lines.append(f"║ 📋 TABLE: {table.name:<47}║")
-        lines.append(f"╠{'═' * 58}╣")
+    for table in idx.nodes:
+        w(_D_TOP)
+        w(f"\n║ 📋 TABLE: {table.name:<47}║")
+        w(_D_MID)
         
-        lines.append(f"║ COLUMNS:{' ' * 50}║")
-        for col_name, col in table.columns.items():
-            pk = "🔑" if col.is_primary_key else "  "
-            fk = "🔗" if col.is_foreign_key else "  "
-            null = "✓" if col.nullable else "✗"
-            lines.append(f"║   {pk}{fk} {col.name:<20} {col.data_type:<15} NULL:{null} ║")
+        w(_D_COLUMNS)
+        w(idx.col_rendered[table.name])
         
         if table.arguments:
-            lines.append(f"║{' ' * 58}║")
-            lines.append(f"║ CONSTRAINTS:{' ' * 46}║")
+            w(_D_BLANK)
+            w(_D_CONSTRAINTS)
             for arg in table.arguments:
                 arg_type = arg.__class__.__name__
-                lines.append(f"║   • {arg_type:<52}║")
+                w(f"\n║   • {arg_type:<52}║")
         
-        lines.append(f"╚{'═' * 58}╝")
-        lines.append("")
+        w(_D_BOT)
+        w("\n")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_compact(graph: Graph) -> str:
+def _style_compact(graph: Graph, idx: _GraphIndex) -> str:
     """Minimal one-line per table summary."""
-    lines = ["📝 COMPACT VIEW", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("📝 COMPACT VIEW")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
-        rel_count = len(table.relationships)
-        col_count = len(table.columns)
-        lines.append(f"{table.name:<30} │ {col_count:>2} cols │ {rel_count:>2} rels")
+    for table in idx.nodes:
+        w(_ROW_COMPACT(table.name, len(table.columns), len(table.relationships)))
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ==================== RELATIONSHIP-FOCUSED STYLES ====================
 
-def _style_relations(graph: Graph) -> str:
+def _style_relations(graph: Graph, idx: _GraphIndex) -> str:
     """Focus on table relationships with directional arrows."""
-    lines = ["🔗 RELATIONSHIP MAP", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🔗 RELATIONSHIP MAP")
+    w(_HEADER_RULE)
     
     processed = set()
-    for rel in graph.edges:
-        rel_key = (rel.source.table.name, rel.target.table.name, rel.source.name)
+    for source, target, via, rel_type in idx.edge_rows:
+        rel_key = (source, target, via)
         if rel_key not in processed:
-            lines.append(f"{rel.source.table.name:>30} ─[{rel.source.name}]→ {rel.target.table.name}")
-            lines.append(f"{'':>30}   ({rel.relationship_type})")
+            w(f"\n{source:>30} ─[{via}]→ {target}")
+            w(f"\n{'':>30}   ({rel_type})")
             processed.add(rel_key)
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_hierarchy(graph: Graph) -> str:
+def _style_hierarchy(graph: Graph, idx: _GraphIndex) -> str:
     """Tree-like view showing parent-child relationships."""
-    lines = ["🌲 HIERARCHICAL VIEW", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🌲 HIERARCHICAL VIEW")
+    w(_HEADER_RULE)
     
     # Find root tables (tables that are only referenced, not referencing)
-    all_tables = {table.name: table for table in graph.nodes}
-    referenced_tables = set()
-    referencing_tables = set()
-    
-    for rel in graph.edges:
-        referencing_tables.add(rel.source.table.name)
-        referenced_tables.add(rel.target.table.name)
-    
-    roots = [t for t in all_tables.keys() if t not in referencing_tables or t in referenced_tables]
+    out_adj, out_deg, in_deg = idx.out_adj, idx.out_deg, idx.in_deg
+    roots = [t for t in idx.name_to_table if not out_deg[t] or in_deg[t]]
     
     visited = set()
     
-    def print_tree(table_name: str, indent: int = 0, prefix: str = ""):
-        if table_name in visited:
-            lines.append(f"{prefix}↻ {table_name} (circular reference)")
-            return
-        
-        visited.add(table_name)
-        lines.append(f"{prefix}📁 {table_name}")
-        
-        table = all_tables[table_name]
-        children = []
-        for rel in table.relationships:
-            if rel.source.table.name == table_name:
-                children.append(rel.target.table.name)
-        
-        for i, child in enumerate(children):
-            is_last = i == len(children) - 1
-            new_prefix = prefix + ("    " if is_last else "│   ")
-            branch = "└── " if is_last else "├── "
-            print_tree(child, indent + 1, prefix + branch)
-    
     for root in sorted(roots):
-        print_tree(root)
-        lines.append("")
-    
-    return "\n".join(lines)
-
-
-def _style_dependency_chain(graph: Graph) -> str:
-    """Shows the full dependency chain from each table."""
-    lines = ["⛓️  DEPENDENCY CHAINS", "=" * 60, ""]
-    
-    def get_dependencies(table: Table, visited: Set[str] = None) -> List[str]:
-        if visited is None:
-            visited = set()
-        
-        if table.name in visited:
-            return [f"↻{table.name}"]
-        
-        visited.add(table.name)
-        deps = []
-        
-        for rel in table.relationships:
-            if rel.source.table == table:
-                target = rel.target.table
-                sub_deps = get_dependencies(target, visited.copy())
-                for sub in sub_deps:
-                    deps.append(f"{target.name} → {sub}" if sub != target.name else target.name)
-                if not sub_deps:
-                    deps.append(target.name)
-        
-        return deps if deps else [table.name]
-    
-    for table in graph.nodes:
-        lines.append(f"\n🔸 {table.name}:")
-        deps = get_dependencies(table)
-        for dep in set(deps):
-            lines.append(f"   └─→ {dep}")
-    
-    return "\n".join(lines)
-
-
-def _style_bidirectional(graph: Graph) -> str:
+        stack = [(root, "")]  # explicit stack instead of recursion, children are pushed in reverse to keep their order
+        while stack:
+            table_name, prefix = stack.pop()
+            if table_name in visited:
+                w(f"\n{prefix}↻ {table_name} (circular reference)")
+                continue
+            
+            visited.add(table_name)
+            w(f"\n{prefix}📁 {table_name}")
+            
+            children = out_adj[table_name]
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], prefix + ("└── " if i == last else "├── ")))
+        w("\n")
+    
+    return buf.getvalue()
+
+
+def _style_dependency_chain(graph: Graph, idx: _GraphIndex) -> str:
+    """Shows every table each table depends on (directly or through a chain of references)."""
+    buf = StringIO()
+    w = buf.write
+    w("⛓️  DEPENDENCY CHAINS")
+    w(_HEADER_RULE)
+    
+    out_adj, scc_id, scc_members, in_cycle = idx.out_adj, idx.scc_id, idx.scc_members, idx.in_cycle
+    reach: Dict[int, Tuple[str, ...]] = {}  # component → tables reachable from it outside of it
+    
+    def component_reach(root: int) -> Tuple[str, ...]:
+        # Post-order DFS over the condensation (acyclic), so a component's reach doesn't depend on where it was entered from
+        stack = [root]
+        while stack:
+            component = stack[-1]
+            if component in reach:
+                stack.pop()
+                continue
+            successors = [scc_id[target] for member in scc_members[component] for target in out_adj[member]]
+            pending = [successor for successor in successors if successor != component and successor not in reach]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            deps: Dict[str, None] = {}  # ordered set, deduplicated in discovery order
+            for member in scc_members[component]:
+                for target in out_adj[member]:
+                    successor = scc_id[target]
+                    if successor != component:
+                        deps.setdefault(target)
+                        for dep in scc_members[successor]:  # reaching one table of a component reaches all of them
+                            deps.setdefault(dep)
+                        for dep in reach[successor]:
+                            deps.setdefault(dep)
+            reach[component] = tuple(deps)
+        return reach[root]
+    
+    for table in idx.nodes:
+        component = scc_id[table.name]
+        members = scc_members[component]
+        cycle = tuple(f"↻{member}" for member in members) if members[0] in in_cycle else ()  # ↻ the tables of its own cycle
+        w(f"\n\n🔸 {table.name}:")
+        for dep in cycle + component_reach(component) or (table.name,):
+            w(f"\n   └─→ {dep}")
+    
+    return buf.getvalue()
+
+
+def _style_bidirectional(graph: Graph, idx: _GraphIndex) -> str:
     """Shows both incoming and outgoing relationships separately."""
-    lines = ["↔️  BIDIRECTIONAL RELATIONSHIPS", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("↔️  BIDIRECTIONAL RELATIONSHIPS")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
-        outgoing = []
-        incoming = []
-        
-        for rel in table.relationships:
-            if rel.source.table == table:
-                outgoing.append(f"{rel.target.table.name} (via {rel.source.name})")
-            if rel.target.table == table:
-                incoming.append(f"{rel.source.table.name} (via {rel.source.name})")
+    for table in idx.nodes:
+        name = table.name
+        outgoing = [f"{target} (via {via})" for target, via in zip(idx.out_adj[name], idx.out_via[name])]
+        incoming = [f"{source} (via {via})" for source, via in zip(idx.in_adj[name], idx.in_via[name])]
         
-        lines.append(f"\n📊 {table.name}")
+        w(f"\n\n📊 {table.name}")
         
         if outgoing:
-            lines.append(f"   ⬆️  Outgoing ({len(outgoing)}):")
+            w(f"\n   ⬆️  Outgoing ({len(outgoing)}):")
             for out in outgoing:
-                lines.append(f"      → {out}")
+                w(f"\n      → {out}")
         
         if incoming:
-            lines.append(f"   ⬇️  Incoming ({len(incoming)}):")
+            w(f"\n   ⬇️  Incoming ({len(incoming)}):")
             for inc in incoming:
-                lines.append(f"      ← {inc}")
+                w(f"\n      ← {inc}")
         
         if not outgoing and not incoming:
-            lines.append("   🔵 No relationships")
+            w("\n   🔵 No relationships")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ==================== EXPLORATION STYLES ====================
 
-def _style_explorer(graph: Graph) -> str:
+def _style_explorer(graph: Graph, idx: _GraphIndex) -> str:
     """Interactive exploration showing paths from starting points."""
-    lines = ["🧭 DATABASE EXPLORER", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🧭 DATABASE EXPLORER")
+    w(_HEADER_RULE)
     
     # Pick tables with most relationships as starting points
-    sorted_tables = sorted(graph.nodes, key=lambda t: len(t.relationships), reverse=True)
+    sorted_tables = sorted(idx.nodes, key=lambda t: len(t.relationships), reverse=True)
     starting_points = sorted_tables[:3]
     
     for start_table in starting_points:
-        lines.append(f"\n🎯 Starting from: {start_table.name}")
-        visited = set()
-        queue = deque([(start_table, 0, [])])
+        w(f"\n\n🎯 Starting from: {start_table.name}")
+        parent = {}  # visited table → the table it was reached from (None for the start), the paths are read back from it
+        queue = deque([(start_table.name, 0, None)])
         
         while queue:
-            table, depth, path = queue.popleft()
+            name, depth, via = queue.popleft()
             
-            if table.name in visited or depth > 3:
+            if name in parent or depth > 3:
                 continue
             
-            visited.add(table.name)
+            parent[name] = via
+            path = []
+            node = name
+            while node is not None:
+                path.append(node)
+                node = parent[node]
             indent = "  " * depth
-            path_str = " → ".join(path + [table.name])
-            lines.append(f"{indent}{'└─' if depth > 0 else ''}🔹 {table.name} (path: {path_str})")
+            path_str = " → ".join(reversed(path))
+            w(f"\n{indent}{'└─' if depth > 0 else ''}🔹 {name} (path: {path_str})")
             
-            for rel in table.relationships:
-                if rel.source.table == table:
-                    queue.append((rel.target.table, depth + 1, path + [table.name]))
+            for target in idx.out_adj[name]:
+                queue.append((target, depth + 1, name))
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_full_paths(graph: Graph) -> str:
-    """Explores all possible paths through the database."""
-    lines = ["🗺️  ALL DATABASE PATHS", "=" * 60, ""]
+def _bounded_paths(idx: _GraphIndex, start: str, max_depth: int = 4, max_paths: int = 10) -> Tuple[List[List[str]], int]:
+    """
+    Paths leaving start (up to max_depth tables deep), returns the first max_paths of them and the total number of paths.
+
+    Iterative DFS on one mutable path, only the first max_paths paths are materialized, the rest is counted.
+    The result is memoized on the index, so every style asking for the same paths shares a single enumeration.
+    """
+    key = (start, max_depth, max_paths)
+    cached = idx.paths_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    names, out_ids = idx.names, idx.out_ids
+    paths = []
+    count = 0
+    
+    def emit(path: List[int], last: str):
+        nonlocal count
+        count += 1
+        if count <= max_paths:  # only the shown paths are translated back to names
+            paths.append([names[i] for i in path] + [last])
+    
+    start_id = idx.table_id[start]
+    if not out_ids[start_id]:
+        paths.append([start])
+        count = 1
+    
+    path = [start_id]
+    on_path = bytearray(len(names))  # flag per table id, set while the table is on the current path
+    on_path[start_id] = 1
+    stack = [iter(out_ids[start_id])]  # one child iterator per path entry, pushed and popped in lockstep
+    
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            on_path[path.pop()] = 0
+        elif len(path) > max_depth:
+            continue
+        elif on_path[child]:
+            emit(path, f"↻{names[child]}")
+        elif not out_ids[child]:
+            emit(path, names[child])
+        else:
+            path.append(child)
+            on_path[child] = 1
+            stack.append(iter(out_ids[child]))
     
-    def find_all_paths(start: Table, max_depth: int = 4) -> List[List[str]]:
-        paths = []
-        
-        def dfs(current: Table, path: List[str], visited: Set[str]):
-            if len(path) > max_depth:
-                return
-            
-            if current.name in visited:
-                paths.append(path + [f"↻{current.name}"])
-                return
-            
-            new_visited = visited.copy()
-            new_visited.add(current.name)
-            new_path = path + [current.name]
-            
-            has_children = False
-            for rel in current.relationships:
-                if rel.source.table == current:
-                    has_children = True
-                    dfs(rel.target.table, new_path, new_visited)
-            
-            if not has_children:
-                paths.append(new_path)
-        
-        dfs(start, [], set())
-        return paths
+    idx.paths_cache[key] = (paths, count)
+    return paths, count
+
+
+def _style_full_paths(graph: Graph, idx: _GraphIndex) -> str:
+    """Explores all possible paths through the database."""
+    buf = StringIO()
+    w = buf.write
+    w("🗺️  ALL DATABASE PATHS")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes[:5]:  # Limit to first 5 tables to avoid overwhelming output
-        lines.append(f"\n📍 Paths from {table.name}:")
-        paths = find_all_paths(table)
-        for i, path in enumerate(paths[:10], 1):  # Show first 10 paths
-            lines.append(f"   {i}. {' → '.join(path)}")
-        if len(paths) > 10:
-            lines.append(f"   ... and {len(paths) - 10} more paths")
+    for table in idx.nodes[:5]:  # Limit to first 5 tables to avoid overwhelming output
+        w(f"\n\n📍 Paths from {table.name}:")
+        paths, count = _bounded_paths(idx, table.name)
+        for i, path in enumerate(paths, 1):  # Show first 10 paths
+            w(f"\n   {i}. {' → '.join(path)}")
+        if count > 10:
+            w(f"\n   ... and {count - 10} more paths")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_depth_first(graph: Graph) -> str:
+def _style_depth_first(graph: Graph, idx: _GraphIndex) -> str:
     """Depth-first traversal showing full database structure."""
-    lines = ["🔍 DEPTH-FIRST TRAVERSAL", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🔍 DEPTH-FIRST TRAVERSAL")
+    w(_HEADER_RULE)
     
     visited = set()
+    name_to_table, out_adj = idx.name_to_table, idx.out_adj
     
-    def dfs(table: Table, depth: int = 0):
-        if table.name in visited:
-            lines.append(f"{'  ' * depth}↻ {table.name}")
+    def dfs(name: str, depth: int = 0):
+        if name in visited:
+            w(f"\n{'  ' * depth}↻ {name}")
             return
         
-        visited.add(table.name)
-        lines.append(f"{'  ' * depth}{'└─ ' if depth > 0 else ''}📦 {table.name} ({len(table.columns)} columns)")
+        visited.add(name)
+        w(f"\n{'  ' * depth}{'└─ ' if depth > 0 else ''}📦 {name} ({len(name_to_table[name].columns)} columns)")
         
-        for rel in table.relationships:
-            if rel.source.table == table:
-                dfs(rel.target.table, depth + 1)
+        for target in out_adj[name]:
+            dfs(target, depth + 1)
     
-    for table in graph.nodes:
+    for table in idx.nodes:
         if table.name not in visited:
-            dfs(table)
-            lines.append("")
+            dfs(table.name)
+            w("\n")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_breadth_first(graph: Graph) -> str:
+def _style_breadth_first(graph: Graph, idx: _GraphIndex) -> str:
     """Breadth-first traversal showing database layers."""
-    lines = ["📊 BREADTH-FIRST TRAVERSAL (Layers)", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("📊 BREADTH-FIRST TRAVERSAL (Layers)")
+    w(_HEADER_RULE)
     
     # Find root tables
-    referencing = set()
-    for rel in graph.edges:
-        referencing.add(rel.source.table.name)
-    
-    roots = [t for t in graph.nodes if t.name not in referencing]
+    roots = [t.name for t in idx.nodes if not idx.out_deg[t.name]]
     if not roots:
-        roots = [graph.nodes[0]] if graph.nodes else []
+        roots = [idx.nodes[0].name] if idx.nodes else []
     
+    name_to_table, out_adj = idx.name_to_table, idx.out_adj
     visited = set()
-    queue = deque([(table, 0) for table in roots])
+    queue = deque([(name, 0) for name in roots])
     current_level = -1
     
     while queue:
-        table, level = queue.popleft()
+        name, level = queue.popleft()
         
-        if table.name in visited:
+        if name in visited:
             continue
         
-        visited.add(table.name)
+        visited.add(name)
         
         if level != current_level:
             current_level = level
-            lines.append(f"\n🔹 LEVEL {level}:")
+            w(f"\n\n🔹 LEVEL {level}:")
         
-        lines.append(f"   • {table.name} ({len(table.relationships)} relationships)")
+        w(f"\n   • {name} ({len(name_to_table[name].relationships)} relationships)")
         
-        for rel in table.relationships:
-            if rel.source.table == table:
-                queue.append((rel.target.table, level + 1))
+        for target in out_adj[name]:
+            queue.append((target, level + 1))
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ==================== ANALYTICAL STYLES ====================
 
-def _style_stats(graph: Graph) -> str:
+def _style_stats(graph: Graph, idx: _GraphIndex) -> str:
     """Statistical overview of the database structure."""
-    lines = ["📈 DATABASE STATISTICS", "=" * 60, ""]
-    
-    total_tables = len(graph.nodes)
-    total_relationships = len(graph.edges)
-    total_columns = sum(len(t.columns) for t in graph.nodes)
+    buf = StringIO()
+    w = buf.write
+    w("📈 DATABASE STATISTICS")
+    w(_HEADER_RULE)
     
-    lines.append(f"📊 Overview:")
-    lines.append(f"   Tables: {total_tables}")
-    lines.append(f"   Relationships: {total_relationships}")
-    lines.append(f"   Columns: {total_columns}")
-    lines.append(f"   Avg columns per table: {total_columns / max(total_tables, 1):.1f}")
-    lines.append(f"   Avg relationships per table: {total_relationships / max(total_tables, 1):.1f}")
+    total_tables = len(idx.nodes)
+    total_relationships = len(idx.edges)
+    rel_counts = Counter(len(t.relationships) for t in idx.nodes)
+    col_counts = Counter(len(t.columns) for t in idx.nodes)
+    total_columns = sum(count * tables for count, tables in col_counts.items())
+    per_table = total_tables or 1  # an empty graph averages to 0
     
-    lines.append(f"\n🔗 Relationship Distribution:")
-    rel_counts = {}
-    for table in graph.nodes:
-        count = len(table.relationships)
-        rel_counts[count] = rel_counts.get(count, 0) + 1
+    w(f"\n📊 Overview:")
+    w(f"\n   Tables: {total_tables}")
+    w(f"\n   Relationships: {total_relationships}")
+    w(f"\n   Columns: {total_columns}")
+    w(f"\n   Avg columns per table: {total_columns / per_table:.1f}")
+    w(f"\n   Avg relationships per table: {total_relationships / per_table:.1f}")
     
-    for count in sorted(rel_counts.keys()):
-        bar = "█" * rel_counts[count]
-        lines.append(f"   {count:>2} relationships: {bar} ({rel_counts[count]} tables)")
+    w(f"\n\n🔗 Relationship Distribution:")
+    for count, tables in sorted(rel_counts.items()):
+        w(f"\n   {count:>2} relationships: {'█' * tables} ({tables} tables)")
     
-    lines.append(f"\n📏 Column Distribution:")
-    col_counts = {}
-    for table in graph.nodes:
-        count = len(table.columns)
-        col_counts[count] = col_counts.get(count, 0) + 1
+    w(f"\n\n📏 Column Distribution:")
+    for count, tables in sorted(col_counts.items())[:10]:  # Show top 10
+        w(f"\n   {count:>2} columns: {'█' * tables} ({tables} tables)")
     
-    for count in sorted(col_counts.keys())[:10]:  # Show top 10
-        bar = "█" * col_counts[count]
-        lines.append(f"   {count:>2} columns: {bar} ({col_counts[count]} tables)")
-    
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_complexity(graph: Graph) -> str:
+def _style_complexity(graph: Graph, idx: _GraphIndex) -> str:
     """Shows complexity metrics for each table."""
-    lines = ["🧮 TABLE COMPLEXITY ANALYSIS", "=" * 60, ""]
-    
-    complexity_scores = []
-    
-    for table in graph.nodes:
-        # Calculate complexity score
-        col_score = len(table.columns) * 1
-        rel_score = len(table.relationships) * 2
-        constraint_score = len(table.arguments) * 1.5
-        total_score = col_score + rel_score + constraint_score
-        
-        complexity_scores.append((table.name, total_score, len(table.columns), 
-                                  len(table.relationships), len(table.arguments)))
+    buf = StringIO()
+    w = buf.write
+    w("🧮 TABLE COMPLEXITY ANALYSIS")
+    w(_HEADER_RULE)
     
-    complexity_scores.sort(key=lambda x: x[1], reverse=True)
+    complexity_scores = sorted(idx.complexity_rows, key=lambda x: x[1], reverse=True)  # scores are computed in _build_index
     
-    lines.append(f"{'Table':<30} │ Score │ Cols │ Rels │ Constraints")
-    lines.append("─" * 70)
+    w(f"\n{'Table':<30} │ Score │ Cols │ Rels │ Constraints")
+    w(_TABLE_RULE)
     
     for name, score, cols, rels, constraints in complexity_scores:
         complexity = "🔴" if score > 50 else "🟡" if score > 30 else "🟢"
-        lines.append(f"{name:<30} │ {complexity} {score:>3.0f} │ {cols:>4} │ {rels:>4} │ {constraints:>11}")
+        w(f"\n{name:<30} │ {complexity} {score:>3.0f} │ {cols:>4} │ {rels:>4} │ {constraints:>11}")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_centrality(graph: Graph) -> str:
+def _style_centrality(graph: Graph, idx: _GraphIndex) -> str:
     """Identifies central/hub tables in the schema."""
-    lines = ["🎯 TABLE CENTRALITY ANALYSIS", "=" * 60, ""]
-    
-    # Calculate centrality based on incoming and outgoing relationships
-    centrality = {}
+    buf = StringIO()
+    w = buf.write
+    w("🎯 TABLE CENTRALITY ANALYSIS")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
-        incoming = sum(1 for rel in table.relationships if rel.target.table == table)
-        outgoing = sum(1 for rel in table.relationships if rel.source.table == table)
-        total = incoming + outgoing
-        centrality[table.name] = (total, incoming, outgoing)
+    # Centrality based on incoming and outgoing relationships, the degrees come from the shared index
+    in_deg, out_deg = idx.in_deg, idx.out_deg
+    sorted_centrality = sorted(idx.total_deg.items(), key=lambda x: x[1], reverse=True)
     
-    sorted_centrality = sorted(centrality.items(), key=lambda x: x[1][0], reverse=True)
+    w(f"\n{'Table':<30} │ Total │ In  │ Out │ Role")
+    w(_TABLE_RULE)
     
-    lines.append(f"{'Table':<30} │ Total │ In  │ Out │ Role")
-    lines.append("─" * 70)
-    
-    for name, (total, incoming, outgoing) in sorted_centrality:
+    for name, total in sorted_centrality:
+        incoming, outgoing = in_deg[name], out_deg[name]
         if total > 5:
             role = "🌟 HUB"
         elif incoming > outgoing * 2:
@@ -602,19 +783,22 @@ def _style_centrality(graph: Graph) -> str:
         else:
             role = "🔷 NORMAL"
         
-        lines.append(f"{name:<30} │ {total:>5} │ {incoming:>3} │ {outgoing:>3} │ {role}")
+        w(f"\n{name:<30} │ {total:>5} │ {incoming:>3} │ {outgoing:>3} │ {role}")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_isolated(graph: Graph) -> str:
+def _style_isolated(graph: Graph, idx: _GraphIndex) -> str:
     """Shows tables with no or few relationships."""
-    lines = ["🏝️  ISOLATED TABLES", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🏝️  ISOLATED TABLES")
+    w(_HEADER_RULE)
     
     isolated = []
     few_rels = []
     
-    for table in graph.nodes:
+    for table in idx.nodes:
         rel_count = len(table.relationships)
         if rel_count == 0:
             isolated.append(table.name)
@@ -622,338 +806,409 @@ def _style_isolated(graph: Graph) -> str:
             few_rels.append((table.name, rel_count))
     
     if isolated:
-        lines.append(f"\n🔴 Completely Isolated ({len(isolated)}):")
+        w(f"\n\n🔴 Completely Isolated ({len(isolated)}):")
         for name in isolated:
-            lines.append(f"   • {name}")
+            w(f"\n   • {name}")
     
     if few_rels:
-        lines.append(f"\n🟡 Few Relationships ({len(few_rels)}):")
+        w(f"\n\n🟡 Few Relationships ({len(few_rels)}):")
         for name, count in few_rels:
-            lines.append(f"   • {name} ({count} relationship{'s' if count > 1 else ''})")
+            w(f"\n   • {name} ({count} relationship{'s' if count > 1 else ''})")
     
     if not isolated and not few_rels:
-        lines.append("\n✅ All tables are well connected!")
+        w("\n\n✅ All tables are well connected!")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ==================== VISUAL STYLES ====================
 
-def _style_ascii_graph(graph: Graph) -> str:
+def _style_ascii_graph(graph: Graph, idx: _GraphIndex) -> str:
     """ASCII art graph representation."""
-    lines = ["🎨 ASCII GRAPH", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🎨 ASCII GRAPH")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
-        lines.append(f"\n    ╔═══════════════╗")
-        lines.append(f"    ║ {table.name:<13} ║")
-        lines.append(f"    ╚═══════════════╝")
+    for table in idx.nodes:
+        w(f"\n\n    ╔═══════════════╗")
+        w(f"\n    ║ {table.name:<13} ║")
+        w(f"\n    ╚═══════════════╝")
         
-        for rel in table.relationships:
-            if rel.source.table == table:
-                lines.append(f"           │")
-                lines.append(f"           │ {rel.source.name}")
-                lines.append(f"           ↓")
-                lines.append(f"    ┌──────────────┐")
-                lines.append(f"    │ {rel.target.table.name:<12} │")
-                lines.append(f"    └──────────────┘")
+        for target, via in zip(idx.out_adj[table.name], idx.out_via[table.name]):
+            w(f"\n           │")
+            w(f"\n           │ {via}")
+            w(f"\n           ↓")
+            w(f"\n    ┌──────────────┐")
+            w(f"\n    │ {target:<12} │")
+            w(f"\n    └──────────────┘")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_tree(graph: Graph) -> str:
+def _style_tree(graph: Graph, idx: _GraphIndex) -> str:
     """Tree-like ASCII structure."""
-    lines = ["🌳 TREE STRUCTURE", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🌳 TREE STRUCTURE")
+    w(_HEADER_RULE)
     
     visited = set()
+    out_adj = idx.out_adj
     
-    def print_node(table: Table, prefix: str = "", is_last: bool = True):
+    for table in idx.nodes:
         if table.name in visited:
-            lines.append(f"{prefix}{'└── ' if is_last else '├── '}↻ {table.name}")
-            return
-        
-        visited.add(table.name)
-        connector = "└── " if is_last else "├── "
-        lines.append(f"{prefix}{connector}📦 {table.name}")
-        
-        children = [rel.target.table for rel in table.relationships if rel.source.table == table]
+            continue
         
-        for i, child in enumerate(children):
-            extension = "    " if is_last else "│   "
-            print_node(child, prefix + extension, i == len(children) - 1)
-    
-    for table in graph.nodes:
-        if table.name not in visited:
-            print_node(table)
+        stack = [(table.name, "", True)]  # explicit stack instead of recursion, children are pushed in reverse to keep their order
+        while stack:
+            name, prefix, is_last = stack.pop()
+            connector = "└── " if is_last else "├── "
+            if name in visited:
+                w(f"\n{prefix}{connector}↻ {name}")
+                continue
+            
+            visited.add(name)
+            w(f"\n{prefix}{connector}📦 {name}")
+            
+            children = out_adj[name]
+            child_prefix = prefix + ("    " if is_last else "│   ")  # built once, shared by all children
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], child_prefix, i == last))
     
-    return "\n".join(lines)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=64)
+def _box_rule(box_width: int) -> str:
+    """Horizontal border of a box, most tables share the minimum width."""
+    return "━" * (box_width - 2)
 
 
-def _style_boxed(graph: Graph) -> str:
+def _style_boxed(graph: Graph, idx: _GraphIndex) -> str:
     """Tables in ASCII boxes with connections."""
-    lines = ["📦 BOXED VIEW", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("📦 BOXED VIEW")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
+    for table in idx.nodes:
         box_width = max(40, len(table.name) + 4)
+        rule = _box_rule(box_width)
         
-        lines.append(f"\n┏{'━' * (box_width - 2)}┓")
-        lines.append(f"┃ 📋 {table.name:<{box_width - 6}}┃")
-        lines.append(f"┣{'━' * (box_width - 2)}┫")
+        w(f"\n\n┏{rule}┓")
+        w(f"\n┃ 📋 {table.name:<{box_width - 6}}┃")
+        w(f"\n┣{rule}┫")
         
         for col_name, col in list(table.columns.items())[:5]:  # Show first 5 columns
             marker = "🔑" if col.is_primary_key else "🔗" if col.is_foreign_key else "  "
-            lines.append(f"┃ {marker} {col_name:<{box_width - 7}}┃")
+            w(f"\n┃ {marker} {col_name:<{box_width - 7}}┃")
         
         if len(table.columns) > 5:
-            lines.append(f"┃ ... and {len(table.columns) - 5} more columns{' ' * (box_width - 30)}┃")
+            w(f"\n┃ ... and {len(table.columns) - 5} more columns{' ' * (box_width - 30)}┃")
         
-        lines.append(f"┗{'━' * (box_width - 2)}┛")
+        w(f"\n┗{rule}┛")
         
         # Show connections
-        for rel in table.relationships[:3]:  # Show first 3 relationships
-            if rel.source.table == table:
-                lines.append(f"      ║")
-                lines.append(f"      ╚══[{rel.source.name}]═══> {rel.target.table.name}")
+        for target, via in zip(idx.out_adj[table.name][:3], idx.out_via[table.name]):  # Show first 3 relationships
+            w(f"\n      ║")
+            w(f"\n      ╚══[{via}]═══> {target}")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_mermaid(graph: Graph) -> str:
+def _style_mermaid(graph: Graph, idx: _GraphIndex) -> str:
     """Mermaid.js compatible diagram format."""
-    lines = ["🎭 MERMAID DIAGRAM", "=" * 60, ""]
-    lines.append("```mermaid")
-    lines.append("erDiagram")
-    
-    for table in graph.nodes:
+    buf = StringIO()
+    w = buf.write
+    w("🎭 MERMAID DIAGRAM")
+    w(_HEADER_RULE)
+    w("\n```mermaid")
+    w("\nerDiagram")
+    
+    for table in idx.nodes:
         # Define table with columns
         for col_name, col in table.columns.items():
             col_type = col.data_type.replace(" ", "_")
             pk = " PK" if col.is_primary_key else ""
             fk = " FK" if col.is_foreign_key else ""
-            lines.append(f"    {table.name} {{")
-            lines.append(f"        {col_type} {col_name}{pk}{fk}")
-            lines.append(f"    }}")
+            w(f"\n    {table.name} {{")
+            w(f"\n        {col_type} {col_name}{pk}{fk}")
+            w(f"\n    }}")
             break  # Just show structure, mermaid will handle the rest
     
     # Add relationships
     processed = set()
-    for rel in graph.edges:
-        rel_key = (rel.source.table.name, rel.target.table.name)
+    for source, target, via, rel_type in idx.edge_rows:
+        rel_key = (source, target)
         if rel_key not in processed:
             # Determine relationship cardinality
-            if rel.relationship_type == "OneToMany":
+            if rel_type == "OneToMany":
                 connector = "||--o{"
-            elif rel.relationship_type == "ManyToOne":
+            elif rel_type == "ManyToOne":
                 connector = "}o--||"
             else:
                 connector = "||--||"
             
-            lines.append(f"    {rel.source.table.name} {connector} {rel.target.table.name} : \"{rel.source.name}\"")
+            w(f"\n    {source} {connector} {target} : \"{via}\"")
             processed.add(rel_key)
     
-    lines.append("```")
+    w("\n```")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ==================== CONSTRAINT STYLES ====================
 
-def _style_constraints(graph: Graph) -> str:
+def _style_constraints(graph: Graph, idx: _GraphIndex) -> str:
     """Focus on constraints (PK, FK, UNIQUE, etc.)."""
-    lines = ["🔒 CONSTRAINT OVERVIEW", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🔒 CONSTRAINT OVERVIEW")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
+    for table in idx.nodes:
         if not table.arguments:
             continue
         
-        lines.append(f"\n📋 {table.name}:")
+        w(f"\n\n📋 {table.name}:")
         
         for arg in table.arguments:
             arg_type = arg.__class__.__name__
             
             if hasattr(arg, 'columns') and arg.columns:
                 col_names = ", ".join([c.name for c in arg.columns])
-                lines.append(f"   🔹 {arg_type}: {col_names}")
+                w(f"\n   🔹 {arg_type}: {col_names}")
             else:
-                lines.append(f"   🔹 {arg_type}")
+                w(f"\n   🔹 {arg_type}")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_indexes(graph: Graph) -> str:
+def _style_indexes(graph: Graph, idx: _GraphIndex) -> str:
     """Show all indexes in the database."""
-    lines = ["📇 INDEX OVERVIEW", "=" * 60, ""]
+    body = StringIO()  # the total goes in front of the per table listing, so the listing is written aside first
+    w = body.write
     
     total_indexes = 0
     
-    for table in graph.nodes:
-        indexes = [arg for arg in table.arguments if arg.__class__.__name__ == "Index"]
+    for table in idx.nodes:
+        indexes = [arg for arg in table.arguments if isinstance(arg, Index)]
         
         if indexes:
-            lines.append(f"\n📋 {table.name}:")
-            for idx in indexes:
+            w(f"\n\n📋 {table.name}:")
+            for index in indexes:
                 total_indexes += 1
-                col_names = ", ".join([c.name for c in idx.columns]) if hasattr(idx, 'columns') else "N/A"
-                idx_name = idx.name if hasattr(idx, 'name') and idx.name else "unnamed"
-                lines.append(f"   🔹 {idx_name}: ({col_names})")
-    
-    lines.insert(2, f"\nTotal Indexes: {total_indexes}\n")
+                col_names = ", ".join(c.name for c in index.columns)
+                index_name = index.name or "unnamed"
+                w(f"\n   🔹 {index_name}: ({col_names})")
     
-    return "\n".join(lines)
+    return f"📇 INDEX OVERVIEW{_HEADER_RULE}\nTotal Indexes: {total_indexes}\n\n{body.getvalue()}"
 
 
-def _style_primary_keys(graph: Graph) -> str:
+def _style_primary_keys(graph: Graph, idx: _GraphIndex) -> str:
     """Highlight primary key structures."""
-    lines = ["🔑 PRIMARY KEY OVERVIEW", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🔑 PRIMARY KEY OVERVIEW")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
-        pk_cols = [col for col in table.columns.values() if col.is_primary_key]
+    for table in idx.nodes:
+        pk_cols = idx.pk_cols[table.name]
         
         if pk_cols:
-            col_names = ", ".join([col.name for col in pk_cols])
+            col_names = ", ".join(pk_cols)
             pk_type = "Composite" if len(pk_cols) > 1 else "Single"
-            lines.append(f"🔹 {table.name:<30} │ {pk_type:<10} │ {col_names}")
+            w(_ROW_PK(table.name, pk_type, col_names))
         else:
-            lines.append(f"❌ {table.name:<30} │ No PK")
+            w(_ROW_NO_PK(table.name))
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_foreign_keys(graph: Graph) -> str:
+def _style_foreign_keys(graph: Graph, idx: _GraphIndex) -> str:
     """Detailed foreign key relationships."""
-    lines = ["🔗 FOREIGN KEY DETAILS", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🔗 FOREIGN KEY DETAILS")
+    w(_HEADER_RULE)
     
-    for table in graph.nodes:
-        fks = [arg for arg in table.arguments if arg.__class__.__name__ == "ForeignKeyConstraint"]
+    for table in idx.nodes:
+        fks = [arg for arg in table.arguments if isinstance(arg, ForeignKeyConstraint)]
         
         if fks:
-            lines.append(f"\n📋 {table.name}:")
-            for fk in fks:
-                if hasattr(fk, 'columns') and hasattr(fk, 'referenced_table'):
-                    local_cols = ", ".join([c.name for c in fk.columns])
-                    ref_cols = ", ".join([c.name for c in fk.referenced_columns]) if hasattr(fk, 'referenced_columns') else "?"
-                    lines.append(f"   🔗 {local_cols} → {fk.referenced_table.name}({ref_cols})")
+            w(f"\n\n📋 {table.name}:")
+            for fk in fks:  # every ForeignKeyConstraint has its local, referenced table and referenced columns
+                local_cols = ", ".join(c.name for c in fk.columns)
+                ref_cols = ", ".join(c.name for c in fk.referenced_columns)
+                w(f"\n   🔗 {local_cols} → {fk.referenced_table.name}({ref_cols})")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ==================== ADVANCED STYLES ====================
 
-def _style_circular_deps(graph: Graph) -> str:
+def _style_circular_deps(graph: Graph, idx: _GraphIndex) -> str:
     """Detect and show circular dependencies."""
-    lines = ["🔄 CIRCULAR DEPENDENCY DETECTION", "=" * 60, ""]
-    
-    def find_cycles():
-        cycles = []
-        
-        def dfs(table: Table, path: List[str], visited: Set[str]):
-            if table.name in path:
-                cycle_start = path.index(table.name)
-                cycles.append(path[cycle_start:] + [table.name])
-                return
-            
-            if table.name in visited:
-                return
-            
-            visited.add(table.name)
-            
-            for rel in table.relationships:
-                if rel.source.table == table:
-                    dfs(rel.target.table, path + [table.name], visited.copy())
-        
-        for table in graph.nodes:
-            dfs(table, [], set())
-        
-        return cycles
-    
-    cycles = find_cycles()
-    
-    if cycles:
-        lines.append(f"\n⚠️  Found {len(cycles)} circular dependencies:\n")
-        for i, cycle in enumerate(cycles, 1):
-            lines.append(f"   {i}. {' → '.join(cycle)}")
+    buf = StringIO()
+    w = buf.write
+    w("🔄 CIRCULAR DEPENDENCY DETECTION")
+    w(_HEADER_RULE)
+    
+    # Every strongly connected component on a cycle (2+ tables or a self reference) is a circular dependency
+    components = [members for members in idx.scc_members.values() if members[0] in idx.in_cycle]
+    
+    if components:
+        w(f"\n\n⚠️  Found {len(components)} circular dependencies:\n")
+        for i, members in enumerate(components, 1):
+            cycle = _cycle_through(idx, members[0])
+            w(f"\n   {i}. {' → '.join(cycle)}")
+            if len(members) > len(cycle) - 1:  # the component has more tables than this one cycle
+                w(f"\n      ({len(members)} tables involved: {', '.join(members)})")
     else:
-        lines.append("\n✅ No circular dependencies detected!")
+        w("\n\n✅ No circular dependencies detected!")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_orphans(graph: Graph) -> str:
+def _cycle_through(idx: _GraphIndex, start: str) -> List[str]:
+    """Shortest cycle from start back to start, a BFS over the foreign keys inside start's strongly connected component."""
+    out_adj, scc_id = idx.out_adj, idx.scc_id
+    component = scc_id[start]
+    parent: Dict[str, str] = {}
+    queue = deque([start])
+    while queue:
+        name = queue.popleft()
+        for target in out_adj[name]:
+            if target == start:  # closed, walk the parents back to start
+                cycle = [start]
+                while name != start:
+                    cycle.append(name)
+                    name = parent[name]
+                cycle.append(start)
+                cycle.reverse()
+                return cycle
+            if target not in parent and scc_id[target] == component:
+                parent[target] = name
+                queue.append(target)
+    return [start]  # not on a cycle
+
+
+def _style_orphans(graph: Graph, idx: _GraphIndex) -> str:
     """Show tables with no relationships."""
-    lines = ["🏝️  ORPHAN TABLES", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🏝️  ORPHAN TABLES")
+    w(_HEADER_RULE)
     
-    orphans = [table for table in graph.nodes if len(table.relationships) == 0]
+    total_deg = idx.total_deg  # incoming + outgoing edges of the shared index
+    orphans = [table for table in idx.nodes if not total_deg[table.name]]
     
     if orphans:
-        lines.append(f"\nFound {len(orphans)} orphan table(s):\n")
+        w(f"\n\nFound {len(orphans)} orphan table(s):\n")
         for table in orphans:
-            lines.append(f"   🔵 {table.name} ({len(table.columns)} columns)")
+            w(f"\n   🔵 {table.name} ({len(table.columns)} columns)")
     else:
-        lines.append("\n✅ No orphan tables - all tables are connected!")
+        w("\n\n✅ No orphan tables - all tables are connected!")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_network_map(graph: Graph) -> str:
+def _style_network_map(graph: Graph, idx: _GraphIndex) -> str:
     """Network-style overview of table connections."""
-    lines = ["🕸️  NETWORK MAP", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🕸️  NETWORK MAP")
+    w(_HEADER_RULE)
     
     # Create adjacency representation
-    for table in graph.nodes:
-        connections = set()
-        for rel in table.relationships:
-            if rel.source.table == table:
-                connections.add(f"→{rel.target.table.name}")
-            if rel.target.table == table:
-                connections.add(f"←{rel.source.table.name}")
+    for table in idx.nodes:
+        connections = {f"→{target}" for target in idx.out_adj[table.name]}
+        connections.update(f"←{source}" for source in idx.in_adj[table.name])
         
         if connections:
-            lines.append(f"\n{table.name:^30}")
-            lines.append(f"{'─' * 30}")
+            w(f"\n\n{table.name:^30}")
+            w(f"\n{'─' * 30}")
             for conn in sorted(connections):
-                lines.append(f"  {conn}")
+                w(f"\n  {conn}")
         else:
-            lines.append(f"\n{table.name} (isolated)")
+            w(f"\n\n{table.name} (isolated)")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _style_path_finder(graph: Graph) -> str:
+def _style_path_finder(graph: Graph, idx: _GraphIndex) -> str:
     """Find all paths between tables."""
-    lines = ["🛤️  PATH FINDER", "=" * 60, ""]
+    buf = StringIO()
+    w = buf.write
+    w("🛤️  PATH FINDER")
+    w(_HEADER_RULE)
     
-    def find_path(start: Table, end: Table, max_depth: int = 5) -> List[List[str]]:
-        paths = []
-        
-        def dfs(current: Table, target: Table, path: List[str], visited: Set[str]):
-            if len(path) > max_depth:
-                return
-            
-            if current == target and len(path) > 0:
-                paths.append(path + [current.name])
-                return
-            
-            if current.name in visited:
-                return
-            
-            visited.add(current.name)
-            
-            for rel in current.relationships:
-                if rel.source.table == current:
-                    dfs(rel.target.table, target, path + [current.name], visited.copy())
-        
-        dfs(start, end, [], set())
-        return paths
+    from ._graph_kernels import paths_between
+    
+    names, table_id, out_ids, in_ids = idx.names, idx.table_id, idx.out_ids, idx.in_ids
+    
+    def find_path(start: str, end: str, max_depth: int = 5, max_paths: int = 5) -> List[List[str]]:
+        paths = paths_between(out_ids, in_ids, table_id[start], table_id[end], max_depth, max_paths)
+        return [[names[i] for i in path] for path in paths]
     
     # Find paths between first few tables
-    tables = graph.nodes[:3]
+    tables = idx.nodes[:3]
     for i, start in enumerate(tables):
         for end in tables[i+1:]:
-            paths = find_path(start, end)
+            paths = find_path(start.name, end.name)
             if paths:
-                lines.append(f"\n🔍 Paths from {start.name} to {end.name}:")
+                w(f"\n\n🔍 Paths from {start.name} to {end.name}:")
                 for j, path in enumerate(paths[:5], 1):
-                    lines.append(f"   {j}. {' → '.join(path)}")
+                    w(f"\n   {j}. {' → '.join(path)}")
             else:
-                lines.append(f"\n❌ No path found between {start.name} and {end.name}")
-    
-    return "\n".join(lines)
+                w(f"\n\n❌ No path found between {start.name} and {end.name}")
+    
+    return buf.getvalue()
+
+
+# ==================== STYLE REGISTRY ====================
+
+# Style name → handler, in the stable order used for "all" (the single source of truth for the supported styles)
+STYLE_HANDLERS: Dict[str, Callable[[Graph, _GraphIndex], str]] = {
+    "simple": _style_simple,
+    "detailed": _style_detailed,
+    "compact": _style_compact,
+    "relations": _style_relations,
+    "hierarchy": _style_hierarchy,
+    "dependency_chain": _style_dependency_chain,
+    "bidirectional": _style_bidirectional,
+    "explorer": _style_explorer,
+    "full_paths": _style_full_paths,
+    "depth_first": _style_depth_first,
+    "breadth_first": _style_breadth_first,
+    "stats": _style_stats,
+    "complexity": _style_complexity,
+    "centrality": _style_centrality,
+    "isolated": _style_isolated,
+    "ascii_graph": _style_ascii_graph,
+    "tree": _style_tree,
+    "boxed": _style_boxed,
+    "mermaid": _style_mermaid,
+    "constraints": _style_constraints,
+    "indexes": _style_indexes,
+    "primary_keys": _style_primary_keys,
+    "foreign_keys": _style_foreign_keys,
+    "circular_deps": _style_circular_deps,
+    "orphans": _style_orphans,
+    "network_map": _style_network_map,
+    "path_finder": _style_path_finder,
+}
+
+# Path enumerations are exponential in the worst case, "all" leaves them out ("all+paths" includes them)
+_EXPENSIVE_STYLES = ("full_paths", "path_finder")
+_CHEAP_STYLES = tuple(name for name in STYLE_HANDLERS if name not in _EXPENSIVE_STYLES)
+
+
+@lru_cache(maxsize=64)
+def _make_dispatcher(styles: Tuple[str, ...]) -> Tuple[Tuple[Tuple[str, Optional[Callable[[Graph, _GraphIndex], str]]], ...], FrozenSet[str]]:
+    """(style, handler or None) pairs and the index parts they need, resolved once per distinct style selection."""
+    handlers = tuple((name, STYLE_HANDLERS.get(name)) for name in styles)
+    parts = frozenset(part for name in styles for part in _INDEX_PARTS.get(name, ()))
+    return handlers, parts
@@ -2,15 +2,29 @@
 # in the Schemanyd Graph. These are table-associated definitions that are tied to the table
 # itself (as opposed to graph-level relationships).
 
+import sys
 from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .graph import Table, Column
 
+# Constraint types, interned so the constraint_type of every constraint is one of these objects (`is` works)
+UNIQUE = sys.intern("UNIQUE")
+PRIMARY_KEY = sys.intern("PRIMARY KEY")
+FOREIGN_KEY = sys.intern("FOREIGN KEY")
+CHECK = sys.intern("CHECK")
+NOT_NULL = sys.intern("NOT NULL")
+DEFAULT = sys.intern("DEFAULT")
+
+# Name prefix of the column constraints (they have no name of their own), see ColumnConstraint
+_CONSTRAINT_SLUG = {NOT_NULL: "not_null", DEFAULT: "default"}
+
 # - - - LEVEL 1 - TableArgument - - -
 
 class TableArgument:
 
+    __slots__ = ("table", "name")
+
     def __init__(self, table: "Table", name: str):
         """
         - Base container for table-level metadata used by the Schemanyd Graph.
@@ -34,14 +48,18 @@ class TableArgument:
 
 class Constraint(TableArgument):
 
+    __slots__ = ("constraint_type",)
+
     def __init__(self, table: "Table", constraint_type: str, name: str):
         """ Parent class for all constraints. """
         super().__init__(table, name)
-        self.constraint_type = constraint_type
+        self.constraint_type = sys.intern(constraint_type)
 
 
 class Index(TableArgument):
 
+    __slots__ = ("columns",)
+
     def __init__(self, table: "Table", columns: List["Column"], name: str):
         """
         Indexes are not used for Schemanyds logic, they are included for completeness.
@@ -64,6 +82,8 @@ class Index(TableArgument):
 
 class TableConstraint(Constraint):
 
+    __slots__ = ("columns",)
+
     def __init__(self, table: "Table", constraint_type: str, columns: List["Column"], name: str):
         """
         These constraints are set using the SQL keyword `CONSTRAINT`:
@@ -86,6 +106,8 @@ class TableConstraint(Constraint):
 
 class ColumnConstraint(Constraint):
 
+    __slots__ = ("column",)
+
     def __init__(self, table: "Table", constraint_type: str, column: "Column"):
         """
         These constraints are set using the SQL keyword `COLUMN`:
@@ -109,7 +131,10 @@ class ColumnConstraint(Constraint):
             The column the constraint is applied to, can't be a list.
         """
         # Column constraints don't have names, so we generate one from column name and type
-        name = f"{constraint_type.lower().replace(' ', '_')}_{column.name}"
+        slug = _CONSTRAINT_SLUG.get(constraint_type)
+        if slug is None:  # not one of the known column constraints
+            slug = constraint_type.lower().replace(' ', '_')
+        name = f"{slug}_{column.name}"
         super().__init__(table, constraint_type, name)
         self.column = column
 
@@ -117,6 +142,8 @@ class ColumnConstraint(Constraint):
 
 class UniqueConstraint(TableConstraint):
 
+    __slots__ = ()
+
     def __init__(self, table: "Table", columns: List["Column"], name: str):
         """
         Ensures unique values across one or more columns.
@@ -130,11 +157,13 @@ class UniqueConstraint(TableConstraint):
         name: str
             The name of the constraint.
         """
-        super().__init__(table, "UNIQUE", columns, name)
+        super().__init__(table, UNIQUE, columns, name)
 
 
 class PrimaryKeyConstraint(TableConstraint):
 
+    __slots__ = ()
+
     def __init__(self, table: "Table", columns: List["Column"], name: str):
         """
         Uniquely identifies each row in a table.
@@ -148,11 +177,13 @@ class PrimaryKeyConstraint(TableConstraint):
         name: str
             The name of the constraint.
         """
-        super().__init__(table, "PRIMARY KEY", columns, name)
+        super().__init__(table, PRIMARY_KEY, columns, name)
 
 
 class ForeignKeyConstraint(TableConstraint):
 
+    __slots__ = ("referenced_table", "referenced_columns")
+
     def __init__(self, table: "Table", columns: List["Column"], referenced_table: "Table", referenced_columns: List["Column"], name: str):
         """
         Links columns to columns in another table, establishing relationships.
@@ -170,13 +201,15 @@ class ForeignKeyConstraint(TableConstraint):
         name: str
             The name of the constraint.
         """
-        super().__init__(table, "FOREIGN KEY", columns, name)
+        super().__init__(table, FOREIGN_KEY, columns, name)
         self.referenced_table = referenced_table
         self.referenced_columns = referenced_columns
 
 
 class CheckConstraint(TableConstraint):
 
+    __slots__ = ("condition",)
+
     def __init__(self, table: "Table", columns: List["Column"], condition: str, name: str):
         """
         Enforces a boolean condition on column values.
@@ -192,13 +225,15 @@ class CheckConstraint(TableConstraint):
         name: str
             The name of the constraint.
         """
-        super().__init__(table, "CHECK", columns, name)
+        super().__init__(table, CHECK, columns, name)
         self.condition = condition
 
 # - - - LEVEL 4.2 - ColumnConstraints - - -
 
 class NotNullConstraint(ColumnConstraint):
 
+    __slots__ = ()
+
     def __init__(self, table: "Table", column: "Column"):
         """
         Ensures a column cannot contain NULL values.
@@ -212,11 +247,13 @@ class NotNullConstraint(ColumnConstraint):
         column: Column
             The column that cannot be null.
         """
-        super().__init__(table, "NOT NULL", column)
+        super().__init__(table, NOT_NULL, column)
 
 
 class DefaultConstraint(ColumnConstraint):
 
+    __slots__ = ("default_value",)
+
     def __init__(self, table: "Table", column: "Column", default_value: str):
         """
         Provides a default value when no value is specified during insertion.
@@ -232,5 +269,5 @@ class DefaultConstraint(ColumnConstraint):
         default_value: str
             The default value expression (e.g., "CURRENT_TIMESTAMP", "'active'", "0").
         """
-        super().__init__(table, "DEFAULT", column)
+        super().__init__(table, DEFAULT, column)
         self.default_value = default_value